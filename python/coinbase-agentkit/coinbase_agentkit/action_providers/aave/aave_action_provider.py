@@ -3,7 +3,9 @@
 from decimal import Decimal
 from typing import Any
 
-from web3 import Web3
+import requests
+from web3.exceptions import Web3Exception
+from web3.types import BlockIdentifier
 
 from ...network import Network
 from ...wallet_providers import EvmWalletProvider
@@ -11,8 +13,11 @@ from ..action_decorator import create_action
 from ..action_provider import ActionProvider
 from .constants import (
     ASSET_ADDRESSES,
+    HEALTH_FACTOR_CAUTION,
+    HEALTH_FACTOR_INFINITE,
     POOL_ABI,
     POOL_ADDRESSES,
+    RECEIPT_POLL_LATENCY,
     SUPPORTED_NETWORKS,
 )
 from .schemas import (
@@ -24,19 +29,80 @@ from .schemas import (
     AaveWithdrawSchema,
 )
 from .utils import (
+    POW10,
+    _checksum_address,
+    _encode_call,
     approve_token,
     format_amount_from_decimals,
     format_amount_with_decimals,
-    get_asset_price_from_oracle,
-    get_health_factor,
+    get_account_snapshot,
     get_portfolio_details_markdown,
-    get_token_balance,
-    get_token_decimals,
-    get_token_symbol,
+    get_preflight_data,
     get_user_account_data,
     set_user_use_reserve_as_collateral,
 )
 
+_TWO_PLACES = Decimal("0.01")
+
+# Errors a failed contract read can raise: web3 errors (including ContractLogicError and
+# RPC error responses), ValueError from malformed RPC results, and HTTP transport errors
+_RPC_READ_ERRORS = (Web3Exception, ValueError, requests.RequestException)
+
+
+def _format_health_factor(health_factor: Decimal) -> str:
+    """Format a health factor with two decimal places, e.g. "1.50" or "Infinity".
+
+    Args:
+        health_factor: The health factor to format.
+
+    Returns:
+        str: The formatted health factor, matching f"{health_factor:.2f}".
+
+    """
+    # Quantizing is cheaper than the format-spec path but needs the result to fit the
+    # default 28-digit context, so very large or infinite values use the format spec
+    if health_factor.is_finite() and health_factor.adjusted() < 25:
+        return str(health_factor.quantize(_TWO_PLACES))
+    return f"{health_factor:.2f}"
+
+
+def _read_account_snapshot(
+    wallet_provider: EvmWalletProvider,
+    pool_address: str,
+    asset_address: str,
+    block_identifier: BlockIdentifier = "latest",
+) -> dict[str, Any]:
+    """Read the account data and token symbol after a transaction has been mined.
+
+    A read pinned to the transaction's block is retried at "latest" if it fails.
+    The transaction has already gone through when this runs, so a failed read
+    returns empty values for the callers' fallbacks instead of raising; reporting
+    an error here would invite the agent to repeat the transaction.
+
+    Args:
+        wallet_provider: The wallet provider to read with.
+        pool_address: The Aave Pool contract address.
+        asset_address: The token contract address.
+        block_identifier: The block to read at.
+
+    Returns:
+        dict: The snapshot with accountData and symbol, both None if the read failed.
+
+    """
+    try:
+        return get_account_snapshot(wallet_provider, pool_address, asset_address, block_identifier)
+    except _RPC_READ_ERRORS:
+        pass
+
+    # A lagging or load-balanced node may not serve the just-mined block yet
+    if block_identifier != "latest":
+        try:
+            return get_account_snapshot(wallet_provider, pool_address, asset_address, "latest")
+        except _RPC_READ_ERRORS:
+            pass
+
+    return {"accountData": None, "symbol": None}
+
 
 class AaveActionProvider(ActionProvider[EvmWalletProvider]):
     """Provides actions for interacting with Aave V3 protocol."""
@@ -67,7 +133,7 @@ class AaveActionProvider(ActionProvider[EvmWalletProvider]):
             str: The address of the Aave Pool contract.
 
         """
-        return Web3.to_checksum_address(POOL_ADDRESSES[network.network_id])
+        return POOL_ADDRESSES[network.network_id]
 
     def _get_asset_address(self, network: Network, asset_id: str) -> str:
         """Get the asset address based on network and asset ID.
@@ -81,7 +147,7 @@ class AaveActionProvider(ActionProvider[EvmWalletProvider]):
 
         """
         try:
-            return Web3.to_checksum_address(ASSET_ADDRESSES[network.network_id][asset_id])
+            return _checksum_address(ASSET_ADDRESSES[network.network_id][asset_id])
         except KeyError as err:
             raise ValueError(f"Asset {asset_id} not supported on {network.network_id}") from err
 
@@ -118,7 +184,7 @@ Important notes:
 
         """
         try:
-            validated_args = AaveSupplySchema(**args)
+            validated_args = AaveSupplySchema.model_validate(args)
             network = wallet_provider.get_network()
 
             # Check if the network is supported
@@ -137,26 +203,31 @@ Important notes:
             except Exception as e:
                 return f"Error: Could not get asset address for {validated_args.asset_id} on {network.network_id}: {e!s}"
 
+            # Read token decimals, wallet balance and account data in a single call
             try:
-                decimals = get_token_decimals(wallet_provider, asset_address)
+                preflight = get_preflight_data(
+                    wallet_provider, network.network_id, pool_address, asset_address
+                )
+                decimals = preflight["decimals"]
+                if decimals is None:
+                    raise ValueError("decimals() call reverted")
                 amount_atomic = format_amount_with_decimals(validated_args.amount, decimals)
             except Exception as e:
                 return f"Error: Could not get token information for {validated_args.asset_id} on {network.network_id}. The token contract may not be properly deployed or accessible: {e!s}"
 
             # Check wallet balance before proceeding
-            try:
-                wallet_balance = get_token_balance(wallet_provider, asset_address)
-                if wallet_balance < amount_atomic:
-                    human_balance = format_amount_from_decimals(wallet_balance, decimals)
-                    return f"Error: Insufficient balance. You have {human_balance} {validated_args.asset_id}, but trying to supply {validated_args.amount}"
-            except Exception as e:
-                return f"Error: Could not check balance for {validated_args.asset_id} on {network.network_id}. The token contract may not be properly deployed or accessible: {e!s}"
+            wallet_balance = preflight["balance"]
+            if wallet_balance is None:
+                return f"Error: Could not check balance for {validated_args.asset_id} on {network.network_id}. The token contract may not be properly deployed or accessible: balanceOf() call reverted"
+            if wallet_balance < amount_atomic:
+                human_balance = format_amount_from_decimals(wallet_balance, decimals)
+                return f"Error: Insufficient balance. You have {human_balance} {validated_args.asset_id}, but trying to supply {validated_args.amount}"
 
             # Get current health factor for reference
-            try:
-                current_health = get_health_factor(wallet_provider, pool_address)
-            except Exception:
-                current_health = Decimal("Infinity")  # No previous borrows
+            account_data = preflight["accountData"]
+            current_health = (
+                account_data["healthFactor"] if account_data else HEALTH_FACTOR_INFINITE
+            )  # No previous borrows
 
             # Approve Aave to spend tokens
             try:
@@ -166,13 +237,11 @@ Important notes:
 
             # Supply tokens to Aave
             on_behalf_of = validated_args.on_behalf_of or wallet_provider.get_address()
-            pool_contract = Web3().eth.contract(
-                address=Web3.to_checksum_address(pool_address), abi=POOL_ABI
-            )
-            encoded_data = pool_contract.encode_abi(
+            encoded_data = _encode_call(
+                POOL_ABI,
                 "supply",
-                args=[
-                    Web3.to_checksum_address(asset_address),
+                [
+                    asset_address,
                     amount_atomic,
                     on_behalf_of,
                     validated_args.referral_code,
@@ -180,13 +249,15 @@ Important notes:
             )
 
             params = {
-                "to": Web3.to_checksum_address(pool_address),
+                "to": pool_address,
                 "data": encoded_data,
             }
 
             try:
                 tx_hash = wallet_provider.send_transaction(params)
-                wallet_provider.wait_for_transaction_receipt(tx_hash)
+                receipt = wallet_provider.wait_for_transaction_receipt(
+                    tx_hash, poll_latency=RECEIPT_POLL_LATENCY
+                )
             except Exception as e:
                 error_msg = str(e)
                 if (
@@ -196,21 +267,21 @@ Important notes:
                     return f"Error: Could not supply {validated_args.asset_id} to Aave on {network.network_id}. This token may not be properly supported by Aave on this network."
                 return f"Error executing supply transaction: {e!s}"
 
-            # Get new health factor
-            try:
-                new_health = get_health_factor(wallet_provider, pool_address)
-            except Exception:
-                new_health = current_health  # Fallback
-
-            token_symbol = get_token_symbol(wallet_provider, asset_address)
+            # Get new health factor and token symbol in a single call at the transaction's block
+            snapshot = _read_account_snapshot(
+                wallet_provider, pool_address, asset_address, receipt.blockNumber
+            )
+            new_account_data = snapshot["accountData"]
+            new_health = (
+                new_account_data["healthFactor"] if new_account_data else current_health
+            )  # Fallback
+            token_symbol = snapshot["symbol"] or validated_args.asset_id
 
             # Format health factor strings and compose the final message
-            if current_health == Decimal("Infinity") and new_health == Decimal("Infinity"):
+            if current_health == HEALTH_FACTOR_INFINITE and new_health == HEALTH_FACTOR_INFINITE:
                 health_message = ""
             else:
-                health_message = (
-                    f"\nHealth factor changed from {current_health:.2f} to {new_health:.2f}"
-                )
+                health_message = f"\nHealth factor changed from {_format_health_factor(current_health)} to {_format_health_factor(new_health)}"
 
             return (
                 f"Successfully supplied {validated_args.amount} {token_symbol} to Aave.\n"
@@ -253,49 +324,53 @@ Important notes:
 
         """
         try:
-            validated_args = AaveWithdrawSchema(**args)
+            validated_args = AaveWithdrawSchema.model_validate(args)
             network = wallet_provider.get_network()
             pool_address = self._get_pool_address(network)
             asset_address = self._get_asset_address(network, validated_args.asset_id)
 
-            decimals = get_token_decimals(wallet_provider, asset_address)
+            preflight = get_preflight_data(
+                wallet_provider, network.network_id, pool_address, asset_address
+            )
+            decimals = preflight["decimals"]
+            if decimals is None:
+                return f"Error: Could not get token information for {validated_args.asset_id} on {network.network_id}."
             amount_atomic = format_amount_with_decimals(validated_args.amount, decimals)
 
             # Get current health factor for reference
-            try:
-                current_health = get_health_factor(wallet_provider, pool_address)
+            account_data = preflight["accountData"]
+            if account_data is None:
+                return "Error checking account data: getUserAccountData() call reverted"
+            current_health = account_data["healthFactor"]
 
-                # Check if the user has active borrows and the health factor could be affected
-                account_data = get_user_account_data(wallet_provider, pool_address)
-                has_borrows = account_data["totalDebtBaseUnits"] > 0
+            # Check if the user has active borrows and the health factor could be affected
+            has_borrows = account_data["totalDebtBaseUnits"] > 0
 
-                if has_borrows and validated_args.amount == "max":
-                    return "Error: You have active borrows. You cannot withdraw all your collateral. Specify an exact amount instead."
-            except Exception as e:
-                return f"Error checking account data: {e!s}"
+            if has_borrows and validated_args.amount == "max":
+                return "Error: You have active borrows. You cannot withdraw all your collateral. Specify an exact amount instead."
 
             # Execute withdraw from Aave
             to_address = validated_args.to or wallet_provider.get_address()
-            pool_contract = Web3().eth.contract(
-                address=Web3.to_checksum_address(pool_address), abi=POOL_ABI
-            )
-            encoded_data = pool_contract.encode_abi(
+            encoded_data = _encode_call(
+                POOL_ABI,
                 "withdraw",
-                args=[
-                    Web3.to_checksum_address(asset_address),
+                [
+                    asset_address,
                     amount_atomic,
                     to_address,
                 ],
             )
 
             params = {
-                "to": Web3.to_checksum_address(pool_address),
+                "to": pool_address,
                 "data": encoded_data,
             }
 
             try:
                 tx_hash = wallet_provider.send_transaction(params)
-                receipt = wallet_provider.wait_for_transaction_receipt(tx_hash)
+                receipt = wallet_provider.wait_for_transaction_receipt(
+                    tx_hash, poll_latency=RECEIPT_POLL_LATENCY
+                )
 
                 # Check if the transaction was successful
                 if receipt.status != 1:
@@ -303,24 +378,24 @@ Important notes:
             except Exception as e:
                 return f"Error executing withdraw transaction: {e!s}"
 
-            # Get new health factor
-            try:
-                new_health = get_health_factor(wallet_provider, pool_address)
-            except Exception:
-                new_health = Decimal("Infinity")  # Fallback
-
-            token_symbol = get_token_symbol(wallet_provider, asset_address)
+            # Get new health factor and token symbol in a single call at the transaction's block
+            snapshot = _read_account_snapshot(
+                wallet_provider, pool_address, asset_address, receipt.blockNumber
+            )
+            new_account_data = snapshot["accountData"]
+            new_health = (
+                new_account_data["healthFactor"] if new_account_data else HEALTH_FACTOR_INFINITE
+            )  # Fallback
+            token_symbol = snapshot["symbol"] or validated_args.asset_id
             amount_display = (
                 validated_args.amount if validated_args.amount != "max" else "all available"
             )
 
             # Format health factor strings and compose the final message
-            if current_health == Decimal("Infinity") and new_health == Decimal("Infinity"):
+            if current_health == HEALTH_FACTOR_INFINITE and new_health == HEALTH_FACTOR_INFINITE:
                 health_message = ""
             else:
-                health_message = (
-                    f"\nHealth factor changed from {current_health:.2f} to {new_health:.2f}"
-                )
+                health_message = f"\nHealth factor changed from {_format_health_factor(current_health)} to {_format_health_factor(new_health)}"
 
             return (
                 f"Successfully withdrew {amount_display} {token_symbol} from Aave.\n"
@@ -365,63 +440,53 @@ Important notes:
 
         """
         try:
-            validated_args = AaveBorrowSchema(**args)
+            validated_args = AaveBorrowSchema.model_validate(args)
             network = wallet_provider.get_network()
             pool_address = self._get_pool_address(network)
             asset_address = self._get_asset_address(network, validated_args.asset_id)
 
-            decimals = get_token_decimals(wallet_provider, asset_address)
+            preflight = get_preflight_data(
+                wallet_provider, network.network_id, pool_address, asset_address
+            )
+            decimals = preflight["decimals"]
+            if decimals is None:
+                return f"Error: Could not get token information for {validated_args.asset_id} on {network.network_id}."
             amount_atomic = format_amount_with_decimals(validated_args.amount, decimals)
 
             # Check collateral and borrowing capacity
-            try:
-                account_data = get_user_account_data(wallet_provider, pool_address)
-                if account_data["totalCollateralBaseUnits"] == 0:
-                    return "Error: You have no collateral supplied. Supply assets as collateral before borrowing."
-
-                # Get asset price from oracle for accurate USD conversion
-                network = wallet_provider.get_network()
-                network_id = network.network_id
-
-                try:
-                    # Get asset price from Aave Oracle
-                    asset_price = get_asset_price_from_oracle(
-                        wallet_provider, network_id, asset_address
-                    )
-
-                    # Calculate USD value of borrow amount
-                    amount_decimal = Decimal(validated_args.amount)
-                    # Asset price is already in USD base units (scaled by 10^8)
-                    estimated_borrow_base_units = (
-                        amount_decimal * asset_price * Decimal(10 ** (8 - decimals))
-                    )
-
-                    # Compare with available borrows (also in USD base units)
-                    if estimated_borrow_base_units > account_data["availableBorrowsBaseUnits"]:
-                        # Convert to human-readable USD for error message
-                        max_borrow_usd = account_data["availableBorrowsUSD"]
-                        token_symbol = get_token_symbol(wallet_provider, asset_address)
-                        return f"Error: Insufficient borrowing capacity. You can borrow up to ${max_borrow_usd:.4f} worth of assets."
-                except Exception as e:
-                    # Fallback to simpler check if oracle fails
-                    if account_data["availableBorrowsBaseUnits"] == 0:
-                        return "Error: You have no borrowing capacity available."
-                    return f"Error getting asset price: {e}. Please try again."
-            except Exception as e:
-                return f"Error checking account data: {e!s}"
+            account_data = preflight["accountData"]
+            if account_data is None:
+                return "Error checking account data: getUserAccountData() call reverted"
+            if account_data["totalCollateralBaseUnits"] == 0:
+                return "Error: You have no collateral supplied. Supply assets as collateral before borrowing."
+            if account_data["availableBorrowsBaseUnits"] == 0:
+                return "Error: You have no borrowing capacity available."
+
+            # Asset price from the Aave Oracle, read alongside the account data
+            asset_price = preflight["assetPriceBaseUnits"]
+            if asset_price is None:
+                return "Error getting asset price: getAssetPrice() call reverted. Please try again."
+
+            # Asset price is in USD base units (scaled by 10^8), so the borrow value
+            # in base units is the atomic amount times the price over 10^decimals
+            estimated_borrow_base_units = amount_atomic * asset_price // POW10[decimals]
+
+            # Compare with available borrows (also in USD base units)
+            if estimated_borrow_base_units > account_data["availableBorrowsBaseUnits"]:
+                # Convert to human-readable USD for error message
+                max_borrow_usd = account_data["availableBorrowsUSD"]
+                return f"Error: Insufficient borrowing capacity. You can borrow up to ${max_borrow_usd:.4f} worth of assets."
 
             # Get current health factor for reference
             current_health = account_data["healthFactor"]
 
             # Execute borrow from Aave
             on_behalf_of = validated_args.on_behalf_of or wallet_provider.get_address()
-            pool_contract = Web3().eth.contract(
-                address=Web3.to_checksum_address(pool_address), abi=POOL_ABI
-            )
-            encoded_data = pool_contract.encode_abi(
+            encoded_data = _encode_call(
+                POOL_ABI,
                 "borrow",
-                args=[
-                    Web3.to_checksum_address(asset_address),
+                [
+                    asset_address,
                     amount_atomic,
                     validated_args.interest_rate_mode,
                     validated_args.referral_code,
@@ -430,13 +495,15 @@ Important notes:
             )
 
             params = {
-                "to": Web3.to_checksum_address(pool_address),
+                "to": pool_address,
                 "data": encoded_data,
             }
 
             try:
                 tx_hash = wallet_provider.send_transaction(params)
-                receipt = wallet_provider.wait_for_transaction_receipt(tx_hash)
+                receipt = wallet_provider.wait_for_transaction_receipt(
+                    tx_hash, poll_latency=RECEIPT_POLL_LATENCY
+                )
 
                 # Check if the transaction was successful
                 if receipt.status != 1:
@@ -444,25 +511,26 @@ Important notes:
             except Exception as e:
                 return f"Error executing borrow transaction: {e!s}"
 
-            # Get new health factor
-            try:
-                new_account_data = get_user_account_data(wallet_provider, pool_address)
-                new_health = new_account_data["healthFactor"]
-            except Exception:
-                new_health = Decimal("0")  # Default to show warning
-
-            token_symbol = get_token_symbol(wallet_provider, asset_address)
+            # Get new health factor and token symbol in a single call at the transaction's block
+            snapshot = _read_account_snapshot(
+                wallet_provider, pool_address, asset_address, receipt.blockNumber
+            )
+            new_account_data = snapshot["accountData"]
+            new_health = (
+                new_account_data["healthFactor"] if new_account_data else Decimal("0")
+            )  # Default to show warning
+            token_symbol = snapshot["symbol"] or validated_args.asset_id
             interest_mode = "variable" if validated_args.interest_rate_mode == 2 else "stable"
 
             # Warning message if health factor is low
             warning_message = ""
-            if new_health < 1.1 and new_health != Decimal("Infinity"):
-                warning_message = f"\n⚠️ WARNING: Your health factor is now {new_health:.2f}, which is dangerously low. Consider repaying some debt or adding more collateral to avoid liquidation."
+            if new_health < HEALTH_FACTOR_CAUTION and new_health != HEALTH_FACTOR_INFINITE:
+                warning_message = f"\n⚠️ WARNING: Your health factor is now {_format_health_factor(new_health)}, which is dangerously low. Consider repaying some debt or adding more collateral to avoid liquidation."
 
             return (
                 f"Successfully borrowed {validated_args.amount} {token_symbol} from Aave with {interest_mode} interest rate.\n"
                 f"Transaction hash: {tx_hash}\n"
-                f"Health factor changed from {current_health:.2f} to {new_health:.2f}"
+                f"Health factor changed from {_format_health_factor(current_health)} to {_format_health_factor(new_health)}"
                 f"{warning_message}"
             )
         except Exception as e:
@@ -502,26 +570,33 @@ Important notes:
 
         """
         try:
-            validated_args = AaveRepaySchema(**args)
+            validated_args = AaveRepaySchema.model_validate(args)
             network = wallet_provider.get_network()
             pool_address = self._get_pool_address(network)
             asset_address = self._get_asset_address(network, validated_args.asset_id)
 
-            decimals = get_token_decimals(wallet_provider, asset_address)
+            preflight = get_preflight_data(
+                wallet_provider, network.network_id, pool_address, asset_address
+            )
+            decimals = preflight["decimals"]
+            if decimals is None:
+                return f"Error: Could not get token information for {validated_args.asset_id} on {network.network_id}."
             amount_atomic = format_amount_with_decimals(validated_args.amount, decimals)
 
             # Check wallet balance if not using max (which will use available balance)
             if validated_args.amount != "max":
-                wallet_balance = get_token_balance(wallet_provider, asset_address)
+                wallet_balance = preflight["balance"]
+                if wallet_balance is None:
+                    return f"Error: Could not check balance for {validated_args.asset_id} on {network.network_id}."
                 if wallet_balance < amount_atomic:
                     human_balance = format_amount_from_decimals(wallet_balance, decimals)
                     return f"Error: Insufficient balance. You have {human_balance} {validated_args.asset_id}, but trying to repay {validated_args.amount}"
 
             # Get current health factor for reference
-            try:
-                current_health = get_health_factor(wallet_provider, pool_address)
-            except Exception:
-                current_health = Decimal("Infinity")  # No borrows (unlikely if repaying)
+            account_data = preflight["accountData"]
+            current_health = (
+                account_data["healthFactor"] if account_data else HEALTH_FACTOR_INFINITE
+            )  # No borrows (unlikely if repaying)
 
             # Approve Aave to spend tokens (not needed for max amount, but safer to approve anyway)
             try:
@@ -531,13 +606,11 @@ Important notes:
 
             # Execute repay to Aave
             on_behalf_of = validated_args.on_behalf_of or wallet_provider.get_address()
-            pool_contract = Web3().eth.contract(
-                address=Web3.to_checksum_address(pool_address), abi=POOL_ABI
-            )
-            encoded_data = pool_contract.encode_abi(
+            encoded_data = _encode_call(
+                POOL_ABI,
                 "repay",
-                args=[
-                    Web3.to_checksum_address(asset_address),
+                [
+                    asset_address,
                     amount_atomic,
                     validated_args.interest_rate_mode,
                     on_behalf_of,
@@ -545,13 +618,15 @@ Important notes:
             )
 
             params = {
-                "to": Web3.to_checksum_address(pool_address),
+                "to": pool_address,
                 "data": encoded_data,
             }
 
             try:
                 tx_hash = wallet_provider.send_transaction(params)
-                receipt = wallet_provider.wait_for_transaction_receipt(tx_hash)
+                receipt = wallet_provider.wait_for_transaction_receipt(
+                    tx_hash, poll_latency=RECEIPT_POLL_LATENCY
+                )
 
                 # Check if the transaction was successful
                 if receipt.status != 1:
@@ -559,25 +634,25 @@ Important notes:
             except Exception as e:
                 return f"Error executing repay transaction: {e!s}"
 
-            # Get new health factor
-            try:
-                new_health = get_health_factor(wallet_provider, pool_address)
-            except Exception:
-                new_health = current_health  # Fallback
-
-            token_symbol = get_token_symbol(wallet_provider, asset_address)
+            # Get new health factor and token symbol in a single call at the transaction's block
+            snapshot = _read_account_snapshot(
+                wallet_provider, pool_address, asset_address, receipt.blockNumber
+            )
+            new_account_data = snapshot["accountData"]
+            new_health = (
+                new_account_data["healthFactor"] if new_account_data else current_health
+            )  # Fallback
+            token_symbol = snapshot["symbol"] or validated_args.asset_id
             amount_display = (
                 validated_args.amount if validated_args.amount != "max" else "all outstanding"
             )
             interest_mode = "variable" if validated_args.interest_rate_mode == 2 else "stable"
 
             # Format health factor strings and compose the final message
-            if new_health == Decimal("Infinity"):
+            if new_health == HEALTH_FACTOR_INFINITE:
                 health_message = "\nYou have repaid all your debt and have no active borrows."
             else:
-                health_message = (
-                    f"\nHealth factor changed from {current_health:.2f} to {new_health:.2f}"
-                )
+                health_message = f"\nHealth factor changed from {_format_health_factor(current_health)} to {_format_health_factor(new_health)}"
 
             return (
                 f"Successfully repaid {amount_display} {token_symbol} to Aave with {interest_mode} interest rate.\n"
@@ -618,7 +693,7 @@ A higher health factor indicates lower liquidation risk.
 
         """
         try:
-            validated_args = AavePortfolioSchema(**args)
+            validated_args = AavePortfolioSchema.model_validate(args)
             network = wallet_provider.get_network()
             account = validated_args.account or wallet_provider.get_address()
 
@@ -653,16 +728,17 @@ Important notes:
 
         """
         try:
-            validated_args = AaveSetAsCollateralSchema(**args)
+            validated_args = AaveSetAsCollateralSchema.model_validate(args)
             network = wallet_provider.get_network()
             pool_address = self._get_pool_address(network)
             asset_address = self._get_asset_address(network, validated_args.asset_id)
 
             # Get current health factor for reference
             try:
-                current_health = get_health_factor(wallet_provider, pool_address)
+                account_data = get_user_account_data(wallet_provider, pool_address)
+                current_health = account_data["healthFactor"]
             except Exception:
-                current_health = Decimal("Infinity")  # No previous borrows
+                current_health = HEALTH_FACTOR_INFINITE  # No previous borrows
 
             # Execute setUserUseReserveAsCollateral
             try:
@@ -672,36 +748,30 @@ Important notes:
             except Exception as e:
                 return f"Error setting asset as collateral: {e!s}"
 
-            # Get new health factor
-            try:
-                new_health = get_health_factor(wallet_provider, pool_address)
-            except Exception:
+            # Get new health factor, collateral and token symbol in a single call
+            snapshot = _read_account_snapshot(wallet_provider, pool_address, asset_address)
+            account_data = snapshot["accountData"]
+            if account_data:
+                new_health = account_data["healthFactor"]
+                collateral_usd = account_data["totalCollateralUSD"]
+                collateral_base_units = account_data["totalCollateralBaseUnits"]
+            else:
                 new_health = current_health  # Fallback
-
-            token_symbol = get_token_symbol(wallet_provider, asset_address)
-
-            # Get account data to see the changes in collateral
-            try:
-                account_data = get_user_account_data(wallet_provider, pool_address)
-                collateral_eth = account_data["totalCollateralBase"]
-                collateral_wei = account_data["totalCollateralWei"]
-            except Exception:
-                collateral_eth = Decimal("0")
-                collateral_wei = 0
+                collateral_usd = Decimal("0")
+                collateral_base_units = 0
+            token_symbol = snapshot["symbol"] or validated_args.asset_id
 
             # Format health factor strings and compose the final message
-            if current_health == Decimal("Infinity") and new_health == Decimal("Infinity"):
+            if current_health == HEALTH_FACTOR_INFINITE and new_health == HEALTH_FACTOR_INFINITE:
                 health_message = ""
             else:
-                health_message = (
-                    f"\nHealth factor changed from {current_health:.2f} to {new_health:.2f}"
-                )
+                health_message = f"\nHealth factor changed from {_format_health_factor(current_health)} to {_format_health_factor(new_health)}"
 
             action = "enabled" if validated_args.use_as_collateral else "disabled"
             return (
                 f"Successfully {action} {token_symbol} as collateral.\n"
                 f"Transaction hash: {tx_hash}\n"
-                f"Total collateral now: {collateral_eth} ETH ({collateral_wei} Wei)"
+                f"Total collateral now: {collateral_usd:.2f} USD ({collateral_base_units} base units)"
                 f"{health_message}"
             )
         except Exception as e:
@@ -1,6 +1,17 @@
 """Constants for Aave action provider."""
 
-SUPPORTED_NETWORKS = ["base-mainnet"]
+from decimal import Decimal
+
+SUPPORTED_NETWORKS = frozenset({"base-mainnet"})
+
+# Health factor of an account without debt, and the thresholds used to grade positions
+HEALTH_FACTOR_INFINITE = Decimal("Infinity")
+HEALTH_FACTOR_HEALTHY = Decimal(2)
+HEALTH_FACTOR_LOW = Decimal("1.5")
+HEALTH_FACTOR_CAUTION = Decimal("1.1")
+
+# Seconds between receipt polls, half of Base's 2 second block time
+RECEIPT_POLL_LATENCY = 1.0
 
 # Asset addresses for supported networks
 ASSET_ADDRESSES = {
@@ -16,10 +27,10 @@ ASSET_ADDRESSES = {
 
 # Pool contract addresses
 POOL_ADDRESSES = {
-    "base-mainnet": "0xa238dd80c259a72e81d7e4664a9801593f98d1c5",
+    "base-mainnet": "0xA238Dd80C259a72e81d7e4664a9801593F98d1c5",
 }
 
-# Aave Price Oracle addresses
+# Aave Price Oracle addresses (pool and oracle addresses are stored EIP-55 checksummed)
 PRICE_ORACLE_ADDRESSES = {
     "base-mainnet": "0x2Cc0Fc26eD4563A5ce5e8bdcfe1A2878676Ae156",
 }
@@ -123,3 +134,38 @@ PRICE_ORACLE_ABI = [
         "type": "function",
     },
 ]
+
+# Multicall3 is deployed at the same address on all supported networks
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Multicall3 ABI - aggregate3 for batching view calls into a single eth_call
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
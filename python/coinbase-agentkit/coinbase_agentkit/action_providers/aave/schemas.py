@@ -1,14 +1,16 @@
 """Schemas for Aave action provider."""
 
-from typing import Literal
+from typing import Literal, TypeAlias
 
 from pydantic import BaseModel, Field
 
+AssetId: TypeAlias = Literal["weth", "usdc", "cbeth", "wstETH", "cbBTC", "GHO"]
+
 
 class AaveSupplySchema(BaseModel):
     """Input schema for supplying assets to Aave."""
 
-    asset_id: Literal["weth", "usdc", "cbeth", "wstETH", "cbBTC", "GHO"] = Field(
+    asset_id: AssetId = Field(
         ...,
         description="The asset ID to supply to the Aave market, one of `weth`, `usdc`, `cbeth`, `wstETH`, `cbBTC`, or `GHO`",
     )
@@ -29,7 +31,7 @@ class AaveSupplySchema(BaseModel):
 class AaveWithdrawSchema(BaseModel):
     """Input schema for withdrawing assets from Aave."""
 
-    asset_id: Literal["weth", "usdc", "cbeth", "wstETH", "cbBTC", "GHO"] = Field(
+    asset_id: AssetId = Field(
         ...,
         description="The asset ID to withdraw from the Aave market, one of `weth`, `usdc`, `cbeth`, `wstETH`, `cbBTC`, or `GHO`",
     )
@@ -46,7 +48,7 @@ class AaveWithdrawSchema(BaseModel):
 class AaveBorrowSchema(BaseModel):
     """Input schema for borrowing assets from Aave."""
 
-    asset_id: Literal["weth", "usdc", "cbeth", "wstETH", "cbBTC", "GHO"] = Field(
+    asset_id: AssetId = Field(
         ...,
         description="The asset ID to borrow from the Aave market, one of `weth`, `usdc`, `cbeth`, `wstETH`, `cbBTC`, or `GHO`",
     )
@@ -71,7 +73,7 @@ class AaveBorrowSchema(BaseModel):
 class AaveRepaySchema(BaseModel):
     """Input schema for repaying borrowed assets to Aave."""
 
-    asset_id: Literal["weth", "usdc", "cbeth", "wstETH", "cbBTC", "GHO"] = Field(
+    asset_id: AssetId = Field(
         ...,
         description="The asset ID to repay to the Aave market, one of `weth`, `usdc`, `cbeth`, `wstETH`, `cbBTC`, or `GHO`",
     )
@@ -92,7 +94,7 @@ class AaveRepaySchema(BaseModel):
 class AaveSetAsCollateralSchema(BaseModel):
     """Schema for setting an asset as collateral in Aave."""
 
-    asset_id: Literal["weth", "usdc", "cbeth", "wstETH", "cbBTC", "GHO"] = Field(
+    asset_id: AssetId = Field(
         description="The asset ID to set as collateral, one of `weth`, `usdc`, `cbeth`, `wstETH`, `cbBTC`, or `GHO`",
     )
     use_as_collateral: bool = Field(
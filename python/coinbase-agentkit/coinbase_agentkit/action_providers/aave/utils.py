@@ -1,18 +1,122 @@
 """Utility functions for Aave action provider."""
 
 from decimal import Decimal
+from functools import lru_cache
+from typing import Any
 
+from eth_abi import decode, encode
+from eth_utils import function_abi_to_4byte_selector, get_abi_input_types, get_abi_output_types
 from web3 import Web3
+from web3.types import BlockIdentifier
 
 from ...wallet_providers import EvmWalletProvider
 from ..erc20.constants import ERC20_ABI
 from .constants import (
+    HEALTH_FACTOR_CAUTION,
+    HEALTH_FACTOR_HEALTHY,
+    HEALTH_FACTOR_INFINITE,
+    HEALTH_FACTOR_LOW,
+    MULTICALL3_ABI,
+    MULTICALL3_ADDRESS,
     POOL_ABI,
     POOL_ADDRESSES,
     PRICE_ORACLE_ABI,
     PRICE_ORACLE_ADDRESSES,
+    RECEIPT_POLL_LATENCY,
 )
 
+# Powers of ten for every token decimals value whose scale still fits in a uint256
+POW10 = tuple(10**i for i in range(78))
+_POW10_DEC = tuple(Decimal(power) for power in POW10)
+_DEC_0 = Decimal(0)
+
+# ERC20 decimals and symbols never change, so they are cached per (network ID, token address)
+_token_decimals_cache: dict[tuple[str, str], int] = {}
+_token_symbol_cache: dict[tuple[str, str], str] = {}
+
+
+@lru_cache(maxsize=1024)
+def _checksum_address(address: str) -> str:
+    """Get the EIP-55 checksummed form of an address, computed once per address."""
+    return Web3.to_checksum_address(address)
+
+
+def _build_function_codecs(
+    abi: list[dict[str, Any]],
+) -> dict[str, tuple[bytes, list[str], list[str]]]:
+    """Derive the selector, input types and output types of every function in an ABI.
+
+    Args:
+        abi: The contract ABI.
+
+    Returns:
+        dict: Function name -> (4-byte selector, input types, output types).
+
+    """
+    codecs: dict[str, tuple[bytes, list[str], list[str]]] = {}
+    for function_abi in abi:
+        if function_abi.get("type") == "function":
+            codecs.setdefault(
+                function_abi["name"],
+                (
+                    function_abi_to_4byte_selector(function_abi),
+                    get_abi_input_types(function_abi),
+                    get_abi_output_types(function_abi),
+                ),
+            )
+    return codecs
+
+
+# Codecs of the ABIs this provider calls, derived once at import and keyed by the ABI
+# constant's id; the constants live for the whole process, so their ids are never reused
+_ABI_CODECS = {
+    id(abi): _build_function_codecs(abi)
+    for abi in (ERC20_ABI, MULTICALL3_ABI, POOL_ABI, PRICE_ORACLE_ABI)
+}
+
+
+def _get_function_codec(
+    abi: list[dict[str, Any]], function_name: str
+) -> tuple[bytes, list[str], list[str]]:
+    """Get the selector, input types and output types of a contract function.
+
+    Codecs of the module's ABI constants are precomputed; any other ABI is derived
+    on each call rather than cached, so callers passing fresh ABIs don't grow memory.
+
+    Args:
+        abi: The contract ABI.
+        function_name: The name of the function in the ABI.
+
+    Returns:
+        tuple[bytes, list[str], list[str]]: The 4-byte selector, input types and output types.
+
+    """
+    codecs = _ABI_CODECS.get(id(abi))
+    if codecs is None:
+        codecs = _build_function_codecs(abi)
+    return codecs[function_name]
+
+
+def _encode_call(abi: list[dict[str, Any]], function_name: str, args: list[Any]) -> str:
+    """ABI-encode a contract function call as hex calldata.
+
+    Args:
+        abi: The contract ABI.
+        function_name: The name of the function to call.
+        args: The function arguments.
+
+    Returns:
+        str: The 0x-prefixed calldata.
+
+    """
+    selector, input_types, _ = _get_function_codec(abi, function_name)
+    return "0x" + (selector + encode(input_types, args)).hex()
+
+
+def _token_cache_key(network_id: str, token_address: str) -> tuple[str, str]:
+    """Build the token metadata cache key for a token on a network."""
+    return network_id, token_address.lower()
+
 
 def get_token_decimals(wallet: EvmWalletProvider, token_address: str) -> int:
     """Get the number of decimals for a token.
@@ -25,13 +129,15 @@ def get_token_decimals(wallet: EvmWalletProvider, token_address: str) -> int:
         int: The number of decimals for the token.
 
     """
-    result = wallet.read_contract(
-        contract_address=Web3.to_checksum_address(token_address),
-        abi=ERC20_ABI,
-        function_name="decimals",
-        args=[],
-    )
-    return result
+    key = _token_cache_key(wallet.get_network().network_id, token_address)
+    if key not in _token_decimals_cache:
+        _token_decimals_cache[key] = wallet.read_contract(
+            contract_address=_checksum_address(token_address),
+            abi=ERC20_ABI,
+            function_name="decimals",
+            args=[],
+        )
+    return _token_decimals_cache[key]
 
 
 def get_token_symbol(wallet: EvmWalletProvider, token_address: str) -> str:
@@ -45,12 +151,15 @@ def get_token_symbol(wallet: EvmWalletProvider, token_address: str) -> str:
         str: The token symbol.
 
     """
-    return wallet.read_contract(
-        contract_address=Web3.to_checksum_address(token_address),
-        abi=ERC20_ABI,
-        function_name="symbol",
-        args=[],
-    )
+    key = _token_cache_key(wallet.get_network().network_id, token_address)
+    if key not in _token_symbol_cache:
+        _token_symbol_cache[key] = wallet.read_contract(
+            contract_address=_checksum_address(token_address),
+            abi=ERC20_ABI,
+            function_name="symbol",
+            args=[],
+        )
+    return _token_symbol_cache[key]
 
 
 def get_token_balance(wallet: EvmWalletProvider, token_address: str) -> int:
@@ -65,7 +174,7 @@ def get_token_balance(wallet: EvmWalletProvider, token_address: str) -> int:
 
     """
     return wallet.read_contract(
-        contract_address=Web3.to_checksum_address(token_address),
+        contract_address=_checksum_address(token_address),
         abi=ERC20_ABI,
         function_name="balanceOf",
         args=[wallet.get_address()],
@@ -88,22 +197,18 @@ def format_amount_with_decimals(amount: str, decimals: int) -> int:
             return 2**256 - 1  # uint256 max for Aave's withdraw/repay all
 
         # Handle scientific notation
-        if "e" in amount.lower():
-            amount_decimal = Decimal(amount)
-            return int(amount_decimal * (10**decimals))
+        if "e" in amount or "E" in amount:
+            return int(Decimal(amount) * POW10[decimals])
 
         # Handle regular decimal notation
-        parts = amount.split(".")
-        if len(parts) == 1:
-            return int(parts[0]) * (10**decimals)
-
-        whole, fraction = parts
-        if len(fraction) > decimals:
-            fraction = fraction[:decimals]
-        else:
-            fraction = fraction.ljust(decimals, "0")
-
-        return int(whole) * (10**decimals) + int(fraction)
+        whole, dot, fraction = amount.partition(".")
+        if not dot:
+            return int(whole) * POW10[decimals]
+        if "." in fraction:
+            raise ValueError("multiple decimal points")
+
+        # Truncate or pad the fraction to exactly `decimals` digits
+        return int(whole) * POW10[decimals] + int(fraction[:decimals].ljust(decimals, "0"))
     except ValueError as e:
         raise ValueError(f"Invalid amount format: {amount}") from e
 
@@ -119,13 +224,13 @@ def format_amount_from_decimals(amount: int, decimals: int) -> str:
         str: The amount as a human-readable string.
 
     """
-    if amount == 0:
-        return "0"
+    sign = "-" if amount < 0 else ""
+    whole, fraction = divmod(abs(amount), POW10[decimals])
+    if fraction == 0:
+        return f"{sign}{whole}"
 
-    amount_decimal = Decimal(amount) / (10**decimals)
-    # Format to remove trailing zeros and decimal point if whole number
-    s = str(amount_decimal)
-    return s.rstrip("0").rstrip(".") if "." in s else s
+    # Pad the fraction to the token's decimals and drop trailing zeros
+    return f"{sign}{whole}.{str(fraction).rjust(decimals, '0').rstrip('0')}"
 
 
 def approve_token(
@@ -143,25 +248,24 @@ def approve_token(
         str: Transaction hash of the approval transaction.
 
     """
-    token_contract = Web3().eth.contract(
-        address=Web3.to_checksum_address(token_address), abi=ERC20_ABI
-    )
-    encoded_data = token_contract.encode_abi(
-        "approve", args=[Web3.to_checksum_address(spender_address), amount]
-    )
+    token_address = _checksum_address(token_address)
+    encoded_data = _encode_call(ERC20_ABI, "approve", [_checksum_address(spender_address), amount])
 
     params = {
-        "to": Web3.to_checksum_address(token_address),
+        "to": token_address,
         "data": encoded_data,
     }
 
     tx_hash = wallet.send_transaction(params)
-    wallet.wait_for_transaction_receipt(tx_hash)
+    wallet.wait_for_transaction_receipt(tx_hash, poll_latency=RECEIPT_POLL_LATENCY)
     return tx_hash
 
 
 def get_user_account_data(
-    wallet: EvmWalletProvider, pool_address: str, account: str | None = None
+    wallet: EvmWalletProvider,
+    pool_address: str,
+    account: str | None = None,
+    block_identifier: BlockIdentifier = "latest",
 ) -> dict[str, Decimal | str | int]:
     """Get user account data from Aave pool.
 
@@ -169,6 +273,7 @@ def get_user_account_data(
         wallet: The wallet provider for reading from contracts.
         pool_address: The address of the Aave Pool contract.
         account: Optional account address. Defaults to wallet address.
+        block_identifier: The block to read the state at. Defaults to "latest".
 
     Returns:
         Dict[str, Union[Decimal, str, int]]: Dictionary containing account data.
@@ -179,12 +284,26 @@ def get_user_account_data(
 
     # Get account data
     result = wallet.read_contract(
-        contract_address=Web3.to_checksum_address(pool_address),
+        contract_address=_checksum_address(pool_address),
         abi=POOL_ABI,
         function_name="getUserAccountData",
         args=[account],
+        block_identifier=block_identifier,
     )
 
+    return _parse_user_account_data(result)
+
+
+def _parse_user_account_data(result: list[int] | tuple[int, ...]) -> dict[str, Decimal | str | int]:
+    """Convert a raw getUserAccountData result into account data.
+
+    Args:
+        result: The six values returned by the Pool's getUserAccountData function.
+
+    Returns:
+        Dict[str, Union[Decimal, str, int]]: Dictionary containing account data.
+
+    """
     (
         total_collateral_base,
         total_debt_base,
@@ -194,23 +313,25 @@ def get_user_account_data(
         health_factor,
     ) = result
 
+    # Scale the debt by 100 as an int so the percentage needs a single Decimal division
     current_ltv_ratio = (
-        (Decimal(total_debt_base) / Decimal(total_collateral_base)) * Decimal(100)
+        Decimal(total_debt_base * 100) / total_collateral_base
         if total_collateral_base > 0
-        else Decimal(0)
+        else _DEC_0
     )
 
     return {
         # Convert base units (scaled by 10^8) to USD values
-        "totalCollateralUSD": Decimal(total_collateral_base) / Decimal(10**8),
-        "totalDebtUSD": Decimal(total_debt_base) / Decimal(10**8),
-        "availableBorrowsUSD": Decimal(available_borrows_base) / Decimal(10**8),
-        "currentLiquidationThreshold": Decimal(current_liquidation_threshold) / Decimal(10**4),
+        "totalCollateralUSD": Decimal(total_collateral_base) / _POW10_DEC[8],
+        "totalDebtUSD": Decimal(total_debt_base) / _POW10_DEC[8],
+        "availableBorrowsUSD": Decimal(available_borrows_base) / _POW10_DEC[8],
+        "currentLiquidationThreshold": Decimal(current_liquidation_threshold) / _POW10_DEC[4],
         "ltv": current_ltv_ratio,  # Current LTV ratio as percentage
-        "maxLtv": Decimal(ltv) / Decimal(10**4),  # Maximum LTV from protocol
-        "healthFactor": Decimal(health_factor) / Decimal(10**18)
-        if health_factor > 0
-        else Decimal("inf"),
+        "maxLtv": Decimal(ltv) / _POW10_DEC[4],  # Maximum LTV from protocol
+        # Without debt the Pool reports type(uint256).max, which is infinite in practice
+        "healthFactor": Decimal(health_factor) / _POW10_DEC[18]
+        if total_debt_base > 0 and health_factor > 0
+        else HEALTH_FACTOR_INFINITE,
         # Add raw values in base units
         "totalCollateralBaseUnits": total_collateral_base,
         "totalDebtBaseUnits": total_debt_base,
@@ -218,8 +339,145 @@ def get_user_account_data(
     }
 
 
+def multicall(
+    wallet: EvmWalletProvider,
+    calls: list[tuple[str, list[dict[str, Any]], str, list[Any]]],
+    block_identifier: BlockIdentifier = "latest",
+) -> list[Any]:
+    """Batch several contract reads into a single Multicall3 aggregate3 call.
+
+    Args:
+        wallet: The wallet provider for reading from contracts.
+        calls: Tuples of (contract address, ABI, function name, args) to read.
+        block_identifier: The block to read the state at. Defaults to "latest".
+
+    Returns:
+        list[Any]: The decoded result of each call in order, or None for calls that reverted.
+
+    """
+    encoded_calls = []
+    output_types = []
+    for contract_address, abi, function_name, args in calls:
+        encoded_calls.append(
+            (_checksum_address(contract_address), True, _encode_call(abi, function_name, args))
+        )
+        output_types.append(_get_function_codec(abi, function_name)[2])
+
+    results = wallet.read_contract(
+        contract_address=MULTICALL3_ADDRESS,
+        abi=MULTICALL3_ABI,
+        function_name="aggregate3",
+        args=[encoded_calls],
+        block_identifier=block_identifier,
+    )
+
+    decoded = []
+    for (success, return_data), types in zip(results, output_types, strict=True):
+        if not success or not return_data:
+            decoded.append(None)
+            continue
+        values = decode(types, return_data)
+        decoded.append(values[0] if len(values) == 1 else values)
+    return decoded
+
+
+def get_preflight_data(
+    wallet: EvmWalletProvider, network_id: str, pool_address: str, asset_address: str
+) -> dict[str, Any]:
+    """Read everything an Aave action checks before sending a transaction in one round trip.
+
+    Args:
+        wallet: The wallet provider for reading from contracts.
+        network_id: The network ID (e.g. "base-mainnet").
+        pool_address: The address of the Aave Pool contract.
+        asset_address: The address of the asset being acted on.
+
+    Returns:
+        dict[str, Any]: The token decimals, wallet balance, account data (as returned by
+        get_user_account_data) and oracle asset price, both in USD and in base units
+        (USD scaled by 10^8). Values are None if the corresponding read failed.
+
+    """
+    account = wallet.get_address()
+    decimals_key = _token_cache_key(network_id, asset_address)
+    decimals = _token_decimals_cache.get(decimals_key)
+
+    calls = {
+        "balance": (asset_address, ERC20_ABI, "balanceOf", [account]),
+        "accountData": (pool_address, POOL_ABI, "getUserAccountData", [account]),
+    }
+    if decimals is None:
+        calls["decimals"] = (asset_address, ERC20_ABI, "decimals", [])
+    oracle_address = PRICE_ORACLE_ADDRESSES.get(network_id)
+    if oracle_address:
+        calls["assetPrice"] = (
+            oracle_address,
+            PRICE_ORACLE_ABI,
+            "getAssetPrice",
+            [_checksum_address(asset_address)],
+        )
+
+    results = dict(zip(calls, multicall(wallet, list(calls.values())), strict=True))
+
+    if decimals is None and results["decimals"] is not None:
+        decimals = _token_decimals_cache[decimals_key] = results["decimals"]
+    account_result = results["accountData"]
+    asset_price = results.get("assetPrice")
+
+    return {
+        "decimals": decimals,
+        "balance": results["balance"],
+        "accountData": (
+            _parse_user_account_data(account_result) if account_result is not None else None
+        ),
+        "assetPrice": Decimal(asset_price) / _POW10_DEC[8] if asset_price is not None else None,
+        "assetPriceBaseUnits": asset_price,
+    }
+
+
+def get_account_snapshot(
+    wallet: EvmWalletProvider,
+    pool_address: str,
+    asset_address: str,
+    block_identifier: BlockIdentifier = "latest",
+) -> dict[str, Any]:
+    """Read the account data and token symbol shown after an Aave transaction in one round trip.
+
+    Args:
+        wallet: The wallet provider for reading from contracts.
+        pool_address: The address of the Aave Pool contract.
+        asset_address: The address of the asset that was acted on.
+        block_identifier: The block to read the state at, e.g. the transaction's block.
+
+    Returns:
+        dict[str, Any]: The account data (as returned by get_user_account_data) and token
+        symbol. Values are None if the corresponding read failed.
+
+    """
+    symbol_key = _token_cache_key(wallet.get_network().network_id, asset_address)
+    symbol = _token_symbol_cache.get(symbol_key)
+
+    calls = [(pool_address, POOL_ABI, "getUserAccountData", [wallet.get_address()])]
+    if symbol is None:
+        calls.append((asset_address, ERC20_ABI, "symbol", []))
+
+    account_result, *symbol_result = multicall(wallet, calls, block_identifier)
+    if symbol_result and symbol_result[0] is not None:
+        symbol = _token_symbol_cache[symbol_key] = symbol_result[0]
+
+    return {
+        "accountData": (
+            _parse_user_account_data(account_result) if account_result is not None else None
+        ),
+        "symbol": symbol,
+    }
+
+
 def get_health_factor(
-    wallet: EvmWalletProvider, pool_address: str, account: str | None = None
+    wallet: EvmWalletProvider,
+    pool_address: str,
+    account: str | None = None,
+    block_identifier: BlockIdentifier = "latest",
 ) -> Decimal:
     """Get the current health factor for a user.
 
@@ -227,12 +485,13 @@ def get_health_factor(
         wallet: The wallet provider for reading from contracts.
         pool_address: The address of the Aave Pool contract.
         account: Optional account address. Defaults to wallet address.
+        block_identifier: The block to read the state at. Defaults to "latest".
 
     Returns:
         Decimal: The current health factor.
 
     """
-    account_data = get_user_account_data(wallet, Web3.to_checksum_address(pool_address), account)
+    account_data = get_user_account_data(wallet, pool_address, account, block_identifier)
     return account_data["healthFactor"]
 
 
@@ -255,81 +514,78 @@ def get_portfolio_details_markdown(
 
     try:
         # Get the Pool contract address
-        pool_address = Web3.to_checksum_address(POOL_ADDRESSES[network_id])
+        pool_address = POOL_ADDRESSES[network_id]
 
         # Get user account data from Pool contract
         account_data = get_user_account_data(wallet, pool_address, account)
 
-        # Format the account data into markdown
-        markdown = f"# Aave Portfolio for {account[:6]}...{account[-4:]}\n\n"
-
-        # Format ETH values with scientific notation for small amounts
-        def format_eth(value):
-            if abs(value) < 1e-4:
-                return f"{value:.2e}"
-            return f"{value:.18f}"
-
-        # Summary section
-        markdown += "## Summary\n\n"
-        markdown += f"**Total Collateral (USD):** {account_data['totalCollateralUSD']:.3f}\n"
-        markdown += (
-            f"**Total Collateral (Base Units):** {account_data['totalCollateralBaseUnits']}\n"
-        )
-        markdown += f"**Total Debt (USD):** {account_data['totalDebtUSD']:.3f}\n"
-        markdown += f"**Total Debt (Base Units):** {account_data['totalDebtBaseUnits']}\n"
-        markdown += f"**Available to Borrow (USD):** {account_data['availableBorrowsUSD']:.3f}\n"
-        markdown += (
-            f"**Available to Borrow (Base Units):** {account_data['availableBorrowsBaseUnits']}\n"
-        )
-        markdown += (
-            f"**Liquidation Threshold:** {account_data['currentLiquidationThreshold']:.3%}\n"
-        )
-        markdown += f"**LTV:** {account_data['ltv']:.2f}%  # Current LTV ratio as percentage\n"
-        markdown += f"**Max LTV:** {account_data['maxLtv']:.3%}  # Maximum LTV from protocol\n"
+        # Format the account data into markdown, joining the lines once at the end
+        health_factor = account_data["healthFactor"]
+        parts = [
+            f"# Aave Portfolio for {account[:6]}...{account[-4:]}\n\n",
+            # Summary section
+            "## Summary\n\n",
+            f"**Total Collateral (USD):** {account_data['totalCollateralUSD']:.3f}\n",
+            f"**Total Collateral (Base Units):** {account_data['totalCollateralBaseUnits']}\n",
+            f"**Total Debt (USD):** {account_data['totalDebtUSD']:.3f}\n",
+            f"**Total Debt (Base Units):** {account_data['totalDebtBaseUnits']}\n",
+            f"**Available to Borrow (USD):** {account_data['availableBorrowsUSD']:.3f}\n",
+            f"**Available to Borrow (Base Units):** {account_data['availableBorrowsBaseUnits']}\n",
+            f"**Liquidation Threshold:** {account_data['currentLiquidationThreshold']:.3%}\n",
+            f"**LTV:** {account_data['ltv']:.2f}%  # Current LTV ratio as percentage\n",
+            f"**Max LTV:** {account_data['maxLtv']:.3%}  # Maximum LTV from protocol\n",
+        ]
 
         # Health factor with color indicators
-        health_factor = account_data["healthFactor"]
-        if health_factor == Decimal("inf"):
-            markdown += "**Health Factor:** ∞ (No borrows)\n"
-        elif health_factor >= 2:
-            markdown += f"**Health Factor:** {health_factor:.3f} (Healthy)\n"
-        elif health_factor >= 1.1:
-            markdown += f"**Health Factor:** {health_factor:.3f} (Caution)\n"
+        if health_factor == HEALTH_FACTOR_INFINITE:
+            parts.append("**Health Factor:** ∞ (No borrows)\n")
+        elif health_factor >= HEALTH_FACTOR_HEALTHY:
+            parts.append(f"**Health Factor:** {health_factor:.3f} (Healthy)\n")
+        elif health_factor >= HEALTH_FACTOR_CAUTION:
+            parts.append(f"**Health Factor:** {health_factor:.3f} (Caution)\n")
         else:
-            markdown += f"**Health Factor:** {health_factor:.3f} (Danger - Risk of Liquidation)\n"
+            parts.append(f"**Health Factor:** {health_factor:.3f} (Danger - Risk of Liquidation)\n")
 
         # Add recommendations section
-        markdown += "\n## Recommendations\n\n"
+        parts.append("\n## Recommendations\n\n")
 
         # Check if there's actually debt or collateral
         has_collateral = account_data["totalCollateralBaseUnits"] > 0
         has_debt = account_data["totalDebtBaseUnits"] > 0
-        low_health = account_data["healthFactor"] < 1.5 and account_data["healthFactor"] != Decimal(
-            "inf"
-        )
+        low_health = health_factor < HEALTH_FACTOR_LOW and health_factor != HEALTH_FACTOR_INFINITE
 
         if has_collateral and has_debt:
-            markdown += f"- You have borrowed {account_data['totalDebtUSD']:.2f} USD ({account_data['totalDebtBaseUnits']}) against your collateral. "
+            parts.append(
+                f"- You have borrowed {account_data['totalDebtUSD']:.2f} USD ({account_data['totalDebtBaseUnits']}) against your collateral. "
+            )
             if low_health:
-                markdown += "Your health factor is low, consider repaying some debt or adding more collateral to avoid liquidation.\n"
+                parts.append(
+                    "Your health factor is low, consider repaying some debt or adding more collateral to avoid liquidation.\n"
+                )
             else:
-                markdown += "Your position is healthy. You can borrow more or repay your existing debt as needed.\n"
+                parts.append(
+                    "Your position is healthy. You can borrow more or repay your existing debt as needed.\n"
+                )
         elif has_collateral and not has_debt:
-            markdown += f"- You have supplied {account_data['totalCollateralUSD']:.2f} USD ({account_data['totalCollateralBaseUnits']}) as collateral but have no borrows. "
-            markdown += "You can borrow against your collateral or withdraw if needed.\n"
+            parts.append(
+                f"- You have supplied {account_data['totalCollateralUSD']:.2f} USD ({account_data['totalCollateralBaseUnits']}) as collateral but have no borrows. "
+                "You can borrow against your collateral or withdraw if needed.\n"
+            )
         elif not has_collateral and not has_debt and low_health:
             # Special case: No collateral, no debt, but low health factor
-            markdown += (
+            parts.append(
                 "- Your account shows no collateral and no debt, but has a low health factor. "
+                "This could be due to dust amounts or rounding. Consider adding more collateral to improve your position.\n"
             )
-            markdown += "This could be due to dust amounts or rounding. Consider adding more collateral to improve your position.\n"
         elif not has_collateral and not has_debt:
-            markdown += "- You have no collateral supplied and no borrows in this Aave market.\n"
+            parts.append("- You have no collateral supplied and no borrows in this Aave market.\n")
         else:
             # Fallback case
-            markdown += "- Review your account status and consider adjusting your position based on market conditions.\n"
+            parts.append(
+                "- Review your account status and consider adjusting your position based on market conditions.\n"
+            )
 
-        return markdown
+        return "".join(parts)
     except Exception as e:
         # If there was an error fetching data, return an error message
         return f"Error fetching Aave portfolio: {e!s}"
@@ -350,21 +606,20 @@ def set_user_use_reserve_as_collateral(
         str: Transaction hash of the operation.
 
     """
-    pool_contract = Web3().eth.contract(
-        address=Web3.to_checksum_address(pool_address), abi=POOL_ABI
-    )
-    encoded_data = pool_contract.encode_abi(
+    pool_address = _checksum_address(pool_address)
+    encoded_data = _encode_call(
+        POOL_ABI,
         "setUserUseReserveAsCollateral",
-        args=[Web3.to_checksum_address(asset_address), use_as_collateral],
+        [_checksum_address(asset_address), use_as_collateral],
     )
 
     params = {
-        "to": Web3.to_checksum_address(pool_address),
+        "to": pool_address,
         "data": encoded_data,
     }
 
     tx_hash = wallet.send_transaction(params)
-    wallet.wait_for_transaction_receipt(tx_hash)
+    wallet.wait_for_transaction_receipt(tx_hash, poll_latency=RECEIPT_POLL_LATENCY)
     return tx_hash
 
 
@@ -388,11 +643,11 @@ def get_asset_price_from_oracle(
 
     # Get asset price
     asset_price = wallet.read_contract(
-        Web3.to_checksum_address(oracle_address),
+        oracle_address,
         PRICE_ORACLE_ABI,
         "getAssetPrice",
-        [Web3.to_checksum_address(asset_address)],
+        [_checksum_address(asset_address)],
     )
 
     # Convert to decimal with proper scaling
-    return Decimal(asset_price) / Decimal(10**8)
+    return Decimal(asset_price) / _POW10_DEC[8]
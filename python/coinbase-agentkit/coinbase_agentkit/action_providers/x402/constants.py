@@ -10,13 +10,24 @@ KNOWN_FACILITATORS: dict[str, str] = {
 
 DEFAULT_FACILITATOR = "cdp"
 
+# Maximum number of discovery pages fetched in parallel once the total is known
+DISCOVERY_MAX_CONCURRENCY = 8
+
+# Number of discovery pages kept for conditional revalidation; the oldest are evicted first
+DISCOVERY_PAGE_CACHE_SIZE = 32
+
+# Upper bound on a server-requested Retry-After delay, so a tool call can't stall indefinitely
+MAX_RETRY_AFTER_SECONDS = 60
+
 # Supported networks for x402 payment protocol
-SUPPORTED_NETWORKS = [
-    "base-mainnet",
-    "base-sepolia",
-    "solana-mainnet",
-    "solana-devnet",
-]
+SUPPORTED_NETWORKS = frozenset(
+    {
+        "base-mainnet",
+        "base-sepolia",
+        "solana-mainnet",
+        "solana-devnet",
+    }
+)
 
 # USDC token addresses for Solana networks
 SOLANA_USDC_ADDRESSES: dict[str, str] = {
@@ -33,6 +44,13 @@ NETWORK_MAPPINGS: dict[str, list[str]] = {
     "solana-devnet": ["solana-devnet", "solana:EtWTRABZaYq6iMfeYKouRu166VU2xqa1"],
 }
 
+# Reverse of NETWORK_MAPPINGS: v1 or v2 (CAIP-2) network identifier to internal network ID.
+NETWORK_ID_BY_IDENTIFIER: dict[str, str] = {
+    identifier: network_id
+    for network_id, identifiers in NETWORK_MAPPINGS.items()
+    for identifier in identifiers
+}
+
 # x402 protocol version type
 X402Version = int  # 1 or 2
 
@@ -3,12 +3,12 @@
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .constants import DEFAULT_FACILITATOR
 
 
-@dataclass
+@dataclass(slots=True)
 class X402Config:
     """Configuration options for X402ActionProvider."""
 
@@ -32,10 +32,7 @@ class X402Config:
 class EmptySchema(BaseModel):
     """Schema for listing registered services/facilitators (no parameters required)."""
 
-    class Config:
-        """Pydantic config."""
-
-        title = "No parameters required"
+    model_config = ConfigDict(title="No parameters required")
 
 
 class RegisterServiceSchema(BaseModel):
@@ -43,10 +40,7 @@ class RegisterServiceSchema(BaseModel):
 
     url: str = Field(..., description="Service URL to register for x402 requests")
 
-    class Config:
-        """Pydantic config."""
-
-        title = "Parameters for registering a service URL for x402 requests"
+    model_config = ConfigDict(title="Parameters for registering a service URL for x402 requests")
 
 
 class ListX402ServicesSchema(BaseModel):
@@ -70,10 +64,7 @@ class ListX402ServicesSchema(BaseModel):
         description="Optional keyword to filter services by description (case-insensitive). Example: 'weather' to find weather-related services.",
     )
 
-    class Config:
-        """Pydantic config."""
-
-        title = "Parameters for listing x402 services with optional filtering"
+    model_config = ConfigDict(title="Parameters for listing x402 services with optional filtering")
 
 
 class HttpRequestSchema(BaseModel):
@@ -106,10 +97,7 @@ class HttpRequestSchema(BaseModel):
         ),
     )
 
-    class Config:
-        """Pydantic config."""
-
-        title = "Instructions for making a basic HTTP request"
+    model_config = ConfigDict(title="Instructions for making a basic HTTP request")
 
 
 class PaymentOptionSchema(BaseModel):
@@ -130,10 +118,7 @@ class PaymentOptionSchema(BaseModel):
     price: str | None = Field(default=None, description="Price (v2 format, e.g., '$0.01')")
     pay_to: str | None = Field(default=None, description="Payment recipient address (v2 format)")
 
-    class Config:
-        """Pydantic config."""
-
-        title = "Payment option supporting both v1 and v2 x402 formats"
+    model_config = ConfigDict(title="Payment option supporting both v1 and v2 x402 formats")
 
 
 class RetryWithX402Schema(BaseModel):
@@ -170,12 +155,11 @@ class RetryWithX402Schema(BaseModel):
         description="The EXACT payment option from acceptablePaymentOptions. Pass the object as-is without modifying any values. The 'amount' field is in atomic units.",
     )
 
-    class Config:
-        """Pydantic config."""
-
-        title = (
+    model_config = ConfigDict(
+        title=(
             "Instructions for retrying a request with x402 payment after receiving a 402 response"
         )
+    )
 
 
 class DirectX402RequestSchema(BaseModel):
@@ -208,10 +192,9 @@ class DirectX402RequestSchema(BaseModel):
         ),
     )
 
-    class Config:
-        """Pydantic config."""
-
-        title = (
+    model_config = ConfigDict(
+        title=(
             "Instructions for making an HTTP request with automatic x402 payment handling. "
             "WARNING: This bypasses user confirmation - only use when explicitly told to skip confirmation!"
         )
+    )
@@ -3,19 +3,34 @@
 from __future__ import annotations
 
 import json
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from email.utils import parsedate_to_datetime
+from functools import cache, lru_cache
+from http.cookiejar import DefaultCookiePolicy
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlencode, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..erc20.constants import TOKEN_ADDRESSES_BY_SYMBOLS
 from ..erc20.utils import get_token_details
 from .constants import (
+    DISCOVERY_MAX_CONCURRENCY,
+    DISCOVERY_PAGE_CACHE_SIZE,
     KNOWN_FACILITATORS,
+    MAX_RETRY_AFTER_SECONDS,
+    NETWORK_ID_BY_IDENTIFIER,
     NETWORK_MAPPINGS,
     SOLANA_USDC_ADDRESSES,
     DiscoveryResource,
+    PaymentOption,
     SimplifiedResource,
     X402Version,
 )
@@ -25,6 +40,33 @@ if TYPE_CHECKING:
     from ...wallet_providers.wallet_provider import WalletProvider
 
 
+# Lowercased USDC address per EVM network, for case-insensitive asset checks
+_EVM_USDC_ADDRESSES: dict[str, str] = {
+    network_id: tokens["USDC"].lower()
+    for network_id, tokens in TOKEN_ADDRESSES_BY_SYMBOLS.items()
+    if "USDC" in tokens
+}
+
+# Parsed discovery pages keyed by URL, with the validators needed to revalidate them:
+# url -> ({"If-None-Match": ..., "If-Modified-Since": ...}, (resources, total)).
+# Kept in insertion order and capped at DISCOVERY_PAGE_CACHE_SIZE, oldest evicted first;
+# the lock guards it against the concurrent page fetches.
+_discovery_page_cache: dict[str, tuple[dict[str, str], tuple[list[DiscoveryResource], int]]] = {}
+_discovery_page_cache_lock = threading.Lock()
+
+# Shared session so discovery pages reuse keep-alive connections instead of a new TLS
+# handshake per request; the pool is sized for the concurrent page fetches.
+# The thread pool workers share it safely because it only sends unauthenticated GETs
+# with per-request headers: nothing on the session is changed after import, the cookie
+# policy below keeps the jar empty, and urllib3's connection pool is thread-safe.
+_SESSION = requests.Session()
+_SESSION.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=DISCOVERY_MAX_CONCURRENCY),
+)
+
+
 def get_x402_networks(network: Network) -> list[str]:
     """Return array of matching network identifiers (both v1 and v2 CAIP-2 formats).
 
@@ -53,10 +95,104 @@ def get_network_id(network: str) -> str:
         The network ID (e.g., "base-mainnet") or the original if not found
 
     """
-    for agentkit_id, formats in NETWORK_MAPPINGS.items():
-        if network in formats:
-            return agentkit_id
-    return network
+    return NETWORK_ID_BY_IDENTIFIER.get(network, network)
+
+
+@cache
+def _get_token_table(network_id: str) -> dict[str, tuple[str, int]]:
+    """Map lowercased ERC20 token addresses on a network to their symbol and decimals.
+
+    Args:
+        network_id: The network ID (e.g., "base-mainnet")
+
+    Returns:
+        Dict of lowercased address -> (symbol, decimals)
+
+    """
+    table: dict[str, tuple[str, int]] = {}
+    for symbol, address in TOKEN_ADDRESSES_BY_SYMBOLS.get(network_id, {}).items():
+        decimals = 6 if symbol in ("USDC", "EURC") else 18
+        table.setdefault(address.lower(), (symbol, decimals))
+    return table
+
+
+@dataclass(frozen=True, slots=True)
+class _AssetContext:
+    """Wallet network details needed to identify and format payment assets."""
+
+    network_id: str | None
+    # EVM network and the wallet provider can use the ERC20 helpers
+    is_evm: bool
+    is_svm: bool
+    # Lowercased address -> (symbol, decimals) of known ERC20 tokens on the network
+    tokens: dict[str, tuple[str, int]]
+    # Lowercased on EVM networks, exact (base58) on Solana networks
+    usdc_address: str | None
+
+
+def _get_asset_context(wallet_provider: WalletProvider) -> _AssetContext:
+    """Resolve the wallet's network once so per-asset checks don't repeat it.
+
+    Args:
+        wallet_provider: The wallet provider for network context
+
+    Returns:
+        The asset context for the wallet's network
+
+    """
+    from ...wallet_providers.evm_wallet_provider import EvmWalletProvider
+
+    wallet_network = wallet_provider.get_network()
+    network_id = wallet_network.network_id
+    is_evm = wallet_network.protocol_family == "evm" and isinstance(
+        wallet_provider, EvmWalletProvider
+    )
+    is_svm = wallet_network.protocol_family == "svm"
+
+    tokens: dict[str, tuple[str, int]] = {}
+    usdc_address = None
+    if is_evm:
+        tokens = _get_token_table(network_id)
+        usdc_address = _EVM_USDC_ADDRESSES.get(network_id)
+    elif is_svm:
+        usdc_address = SOLANA_USDC_ADDRESSES.get(network_id)
+
+    return _AssetContext(
+        network_id=network_id,
+        is_evm=is_evm,
+        is_svm=is_svm,
+        tokens=tokens,
+        usdc_address=usdc_address,
+    )
+
+
+def _get_retry_after_seconds(response: requests.Response) -> float | None:
+    """Read the delay requested by a Retry-After header.
+
+    Args:
+        response: The failed response
+
+    Returns:
+        The delay in seconds (capped at MAX_RETRY_AFTER_SECONDS), or None if absent or invalid
+
+    """
+    retry_after = response.headers.get("Retry-After")
+    if not retry_after:
+        return None
+
+    try:
+        seconds = float(retry_after)
+    except ValueError:
+        # Retry-After may also be an HTTP date
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
 
 
 def _fetch_with_retry(
@@ -64,52 +200,121 @@ def _fetch_with_retry(
     context: str = "",
     max_retries: int = 3,
     initial_delay_ms: int = 1000,
+    headers: dict[str, str] | None = None,
 ) -> requests.Response:
-    """Fetch a URL with retry logic and exponential backoff for errors.
+    """Fetch a URL with retry logic and jittered exponential backoff for errors.
+
+    Client errors other than 429 are not retried. On 429 and 503 responses a
+    Retry-After header extends the backoff delay.
 
     Args:
         url: The URL to fetch
         context: Optional context string for error messages (e.g., "page 1")
         max_retries: Maximum number of retries (default 3)
         initial_delay_ms: Initial delay in milliseconds (default 1000)
+        headers: Optional request headers
 
     Returns:
         The requests Response
 
     Raises:
-        RuntimeError: If all retries fail
+        RuntimeError: If all retries fail or the request fails with a client error
 
     """
     context_str = f" ({context})" if context else ""
 
     for attempt in range(max_retries + 1):
+        response = None
         try:
-            response = requests.get(url, timeout=30)
+            response = _SESSION.get(url, headers=headers, timeout=30)
             if response.ok:
                 return response
             raise RuntimeError(f"HTTP {response.status_code} {response.reason}")
         except Exception as error:
-            if attempt >= max_retries:
+            # Client errors won't succeed on retry, except for rate limiting
+            status = response.status_code if response is not None else None
+            retryable = status is None or status == 429 or not 400 <= status < 500
+
+            if attempt >= max_retries or not retryable:
                 raise RuntimeError(
-                    f"Failed to fetch{context_str} after {max_retries} retries: {error}"
+                    f"Failed to fetch{context_str} after {attempt} retries: {error}"
                 ) from error
 
-            delay_ms = initial_delay_ms * (2**attempt)
+            # Jitter keeps concurrent callers from retrying in lockstep
+            delay_ms = initial_delay_ms * (2**attempt) * random.uniform(0.5, 1.5)
+            if status in (429, 503):
+                retry_after = _get_retry_after_seconds(response)
+                if retry_after is not None:
+                    delay_ms = max(delay_ms, retry_after * 1000)
+
             print(
                 f"Fetch error{context_str}: {error}, "
-                f"retrying in {delay_ms}ms (attempt {attempt + 1}/{max_retries})"
+                f"retrying in {delay_ms:.0f}ms (attempt {attempt + 1}/{max_retries})"
             )
             time.sleep(delay_ms / 1000)
 
     raise RuntimeError(f"Failed to fetch{context_str} after {max_retries} retries")
 
 
+def _fetch_discovery_page(url: str, context: str) -> tuple[list[DiscoveryResource], int] | None:
+    """Fetch and parse a single discovery page.
+
+    Pages served with an ETag or Last-Modified header are cached in memory and
+    revalidated with a conditional request, so an unchanged page costs a 304
+    instead of a full download and parse.
+
+    Args:
+        url: The page URL including limit and offset
+        context: Context string for log and error messages (e.g., "page 1, offset 0")
+
+    Returns:
+        The page's resources and the reported total, or None if the page could not be fetched
+
+    """
+    with _discovery_page_cache_lock:
+        cached = _discovery_page_cache.get(url)
+    try:
+        response = _fetch_with_retry(url, context, headers=cached[0] if cached else None)
+    except RuntimeError:
+        print(f"Failed to fetch {context}, skipping")
+        return None
+
+    # Unchanged since the last fetch: reuse the already parsed page. The list is copied
+    # so callers can't modify the cached entry.
+    if cached and response.status_code == 304:
+        resources, total = cached[1]
+        return list(resources), total
+
+    data = json.loads(response.content)
+    resources = data.get("resources", data.get("items", []))
+    total = data.get("pagination", {}).get("total", 0)
+    page = (resources, total)
+
+    validators = {}
+    if etag := response.headers.get("ETag"):
+        validators["If-None-Match"] = etag
+    if last_modified := response.headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = last_modified
+    with _discovery_page_cache_lock:
+        # Re-inserting moves the URL to the end, so the oldest stored page is evicted first
+        _discovery_page_cache.pop(url, None)
+        if validators and "no-store" not in response.headers.get("Cache-Control", ""):
+            _discovery_page_cache[url] = (validators, (list(resources), total))
+            while len(_discovery_page_cache) > DISCOVERY_PAGE_CACHE_SIZE:
+                del _discovery_page_cache[next(iter(_discovery_page_cache))]
+
+    return page
+
+
 def fetch_all_discovery_resources(
     discovery_url: str,
     page_size: int = 1000,
 ) -> list[DiscoveryResource]:
     """Fetch all resources from the discovery API with pagination.
 
+    The first page is fetched on its own to learn the total; the remaining pages are
+    then fetched concurrently and returned in offset order.
+
     Args:
         discovery_url: The base URL for discovery
         page_size: Number of resources per page (default 1000)
@@ -118,54 +323,227 @@ def fetch_all_discovery_resources(
         Array of all discovered resources
 
     """
-    all_resources: list[DiscoveryResource] = []
-    offset = 0
-    page_number = 1
-    known_total = 0
+    first_page = _fetch_discovery_page(
+        f"{discovery_url}?limit={page_size}&offset=0", "page 1, offset 0"
+    )
+    # If we've never had a successful response, stop after the first failure
+    if first_page is None:
+        return []
 
-    while True:
-        url = f"{discovery_url}?limit={page_size}&offset={offset}"
-        page_context = f"page {page_number}, offset {offset}"
+    resources, total = first_page
+    all_resources: list[DiscoveryResource] = list(resources)
 
-        try:
-            response = _fetch_with_retry(url, page_context)
-        except RuntimeError:
-            # If a page fails, skip to the next page
-            print(f"Failed to fetch {page_context}, skipping to next page")
-            offset += page_size
-            page_number += 1
-
-            # Stop if we've exceeded the known total (from previous successful responses)
-            if known_total > 0 and offset >= known_total:
-                break
-            # If we've never had a successful response, stop after first failure
-            if known_total == 0:
-                break
+    # The first page's length is the server's effective page size
+    stride = len(resources)
+    if stride == 0 or stride >= total:
+        return all_resources
+
+    def fetch_page(page_number: int, offset: int) -> tuple[list[DiscoveryResource], int] | None:
+        return _fetch_discovery_page(
+            f"{discovery_url}?limit={page_size}&offset={offset}",
+            f"page {page_number}, offset {offset}",
+        )
+
+    offsets = range(stride, total, stride)
+    with ThreadPoolExecutor(max_workers=min(DISCOVERY_MAX_CONCURRENCY, len(offsets))) as pool:
+        # map yields in submission order, so resources stay sorted by offset
+        pages = pool.map(fetch_page, range(2, len(offsets) + 2), offsets)
+        for page in pages:
+            # Failed pages are skipped so one bad page doesn't drop the whole listing
+            if page is not None:
+                all_resources.extend(page[0])
+
+    return all_resources
+
+
+def get_payment_amount(option: PaymentOption) -> str | None:
+    """Get the required amount of a payment option in either x402 format.
+
+    - v1: max_amount_required (or maxAmountRequired)
+    - v2: amount, falling back to price
+
+    Args:
+        option: The payment option
+
+    Returns:
+        The amount string, or None if the option has none
+
+    """
+    return (
+        option.get("max_amount_required")
+        or option.get("maxAmountRequired")
+        or option.get("amount")
+        or option.get("price")
+    )
+
+
+def _accepts_network(resource: DiscoveryResource, networks: frozenset[str]) -> bool:
+    """Check whether any payment option of a resource is on one of the given networks.
+
+    Args:
+        resource: The discovery resource
+        networks: Network identifiers to match
+
+    Returns:
+        True if at least one payment option matches
+
+    """
+    return any(option.get("network") in networks for option in resource.get("accepts", []))
+
+
+def _has_valid_description(description: str) -> bool:
+    """Check that a description is neither empty nor the default placeholder.
+
+    Args:
+        description: The resource description
+
+    Returns:
+        True if the description is usable
+
+    """
+    description = description.strip()
+    return bool(description) and description != "Access to protected content"
+
+
+def _version_allowed(resource: DiscoveryResource, versions: frozenset[int]) -> bool:
+    """Check whether a resource's x402 version is allowed.
+
+    Args:
+        resource: The discovery resource
+        versions: Allowed x402 versions
+
+    Returns:
+        True if the version is allowed or the resource has no version info
+
+    """
+    version = resource.get("x402_version", resource.get("x402Version"))
+    return version is None or version in versions
+
+
+def _matches_keyword(resource: DiscoveryResource, description: str, lower_keyword: str) -> bool:
+    """Check whether a keyword appears in the description or the resource URL.
+
+    Args:
+        resource: The discovery resource
+        description: The resource description
+        lower_keyword: The lowercased keyword to search for
+
+    Returns:
+        True if the keyword is found (case-insensitive)
+
+    """
+    if lower_keyword in description.lower():
+        return True
+    url = resource.get("resource") or resource.get("url") or ""
+    return lower_keyword in url.lower()
+
+
+def _within_max_price(
+    resource: DiscoveryResource,
+    max_usdc_price: float,
+    wallet_provider: WalletProvider,
+    networks: frozenset[str],
+    context: _AssetContext,
+    max_atomic_by_asset: dict[str, str | None],
+) -> bool:
+    """Check whether a resource has a USDC payment option within the price limit.
+
+    Args:
+        resource: The discovery resource
+        max_usdc_price: Maximum price in whole USDC units
+        wallet_provider: Wallet provider for asset identification
+        networks: Network identifiers to match
+        context: The wallet's asset context
+        max_atomic_by_asset: Per-call cache of the price limit in atomic units by asset
+
+    Returns:
+        True if a matching USDC option costs at most max_usdc_price
+
+    """
+    for option in resource.get("accepts", []):
+        if option.get("network") not in networks:
+            continue
+
+        asset = option.get("asset")
+        if not asset:
+            continue
+
+        # Check if this is a USDC asset
+        if not _is_usdc_asset(asset, context):
+            continue
 
-            time.sleep(0.25)
+        amount_str = get_payment_amount(option)
+        if not amount_str:
             continue
 
-        data = response.json()
-        resources = data.get("resources", data.get("items", []))
-        total = data.get("pagination", {}).get("total", 0)
+        try:
+            if asset not in max_atomic_by_asset:
+                max_atomic_by_asset[asset] = _convert_whole_units_to_atomic(
+                    max_usdc_price, asset, wallet_provider, context
+                )
+            max_usdc_price_atomic = max_atomic_by_asset[asset]
+            if max_usdc_price_atomic and int(amount_str) <= int(max_usdc_price_atomic):
+                return True
+        except (ValueError, TypeError):
+            # Skip if conversion fails
+            continue
 
-        # Update known total from successful response
-        if total > 0:
-            known_total = total
+    return False
 
-        all_resources.extend(resources)
 
-        # Use pagination.total to determine if we're done
-        offset += len(resources)
-        page_number += 1
+def filter_discovery_resources(
+    resources: list[DiscoveryResource],
+    wallet_networks: list[str],
+    wallet_provider: WalletProvider,
+    max_usdc_price: float = 1.0,
+    allowed_versions: list[X402Version] | None = None,
+    keyword: str | None = None,
+) -> list[DiscoveryResource]:
+    """Apply the network, description, version, keyword and price filters in one pass.
 
-        if len(resources) == 0 or offset >= known_total:
-            break
+    Equivalent to chaining filter_by_network, filter_by_description,
+    filter_by_x402_version, filter_by_keyword (when a keyword is given) and
+    filter_by_max_price, without building the intermediate lists.
 
-        # Small delay between pages to avoid rate limiting
-        time.sleep(0.25)
+    Args:
+        resources: Array of discovery resources
+        wallet_networks: Array of network identifiers to match
+        wallet_provider: Wallet provider for asset identification
+        max_usdc_price: Maximum price in whole USDC units
+        allowed_versions: Array of allowed versions (default: [1, 2])
+        keyword: Optional keyword to search for in descriptions and URLs
 
-    return all_resources
+    Returns:
+        Filtered array of resources
+
+    """
+    networks = frozenset(wallet_networks)
+    versions = frozenset(allowed_versions if allowed_versions is not None else (1, 2))
+    lower_keyword = keyword.lower() if keyword else None
+    context = _get_asset_context(wallet_provider)
+    max_atomic_by_asset: dict[str, str | None] = {}
+
+    filtered: list[DiscoveryResource] = []
+    for resource in resources:
+        if not _accepts_network(resource, networks):
+            continue
+
+        description = _get_resource_description(resource)
+        if not _has_valid_description(description):
+            continue
+
+        if not _version_allowed(resource, versions):
+            continue
+
+        if lower_keyword is not None and not _matches_keyword(resource, description, lower_keyword):
+            continue
+
+        if _within_max_price(
+            resource, max_usdc_price, wallet_provider, networks, context, max_atomic_by_asset
+        ):
+            filtered.append(resource)
+
+    return filtered
 
 
 def filter_by_network(
@@ -184,12 +562,8 @@ def filter_by_network(
         Filtered array of resources
 
     """
-    filtered = []
-    for resource in resources:
-        accepts = resource.get("accepts", [])
-        if any(option.get("network") in wallet_networks for option in accepts):
-            filtered.append(resource)
-    return filtered
+    networks = frozenset(wallet_networks)
+    return [resource for resource in resources if _accepts_network(resource, networks)]
 
 
 def _get_resource_description(resource: DiscoveryResource) -> str:
@@ -233,12 +607,11 @@ def filter_by_description(resources: list[DiscoveryResource]) -> list[DiscoveryR
         Filtered array of resources with valid descriptions
 
     """
-    filtered = []
-    for resource in resources:
-        desc = _get_resource_description(resource).strip()
-        if desc and desc != "Access to protected content":
-            filtered.append(resource)
-    return filtered
+    return [
+        resource
+        for resource in resources
+        if _has_valid_description(_get_resource_description(resource))
+    ]
 
 
 def filter_by_x402_version(
@@ -247,7 +620,7 @@ def filter_by_x402_version(
 ) -> list[DiscoveryResource]:
     """Filter resources by x402 protocol version.
 
-    Uses the x402Version field on the resource.
+    Uses the x402Version field on the resource. Resources without version info are kept.
 
     Args:
         resources: Array of discovery resources
@@ -257,18 +630,8 @@ def filter_by_x402_version(
         Filtered array of resources matching the allowed versions
 
     """
-    if allowed_versions is None:
-        allowed_versions = [1, 2]
-
-    filtered = []
-    for resource in resources:
-        version = resource.get("x402_version", resource.get("x402Version"))
-        if version is None:
-            # Include resources without version info
-            filtered.append(resource)
-        elif version in allowed_versions:
-            filtered.append(resource)
-    return filtered
+    versions = frozenset(allowed_versions if allowed_versions is not None else (1, 2))
+    return [resource for resource in resources if _version_allowed(resource, versions)]
 
 
 def filter_by_keyword(
@@ -289,20 +652,11 @@ def filter_by_keyword(
 
     """
     lower_keyword = keyword.lower()
-    filtered = []
-    for resource in resources:
-        # Check description (version-aware)
-        desc = _get_resource_description(resource).lower()
-        if lower_keyword in desc:
-            filtered.append(resource)
-            continue
-
-        # Also check the URL for keyword matches
-        url = (resource.get("resource") or resource.get("url") or "").lower()
-        if lower_keyword in url:
-            filtered.append(resource)
-
-    return filtered
+    return [
+        resource
+        for resource in resources
+        if _matches_keyword(resource, _get_resource_description(resource), lower_keyword)
+    ]
 
 
 def filter_by_max_price(
@@ -323,54 +677,16 @@ def filter_by_max_price(
         Filtered array of resources within price limit
 
     """
-    filtered: list[DiscoveryResource] = []
-
-    for resource in resources:
-        accepts = resource.get("accepts", [])
-        should_include = False
-
-        for option in accepts:
-            if option.get("network") not in wallet_networks:
-                continue
-
-            asset = option.get("asset")
-            if not asset:
-                continue
-
-            # Check if this is a USDC asset
-            if not is_usdc_asset(asset, wallet_provider):
-                continue
-
-            # Get the amount (supports both v1 maxAmountRequired and v2 amount/price)
-            amount_str = (
-                option.get("max_amount_required")
-                or option.get("maxAmountRequired")
-                or option.get("amount")
-                or option.get("price")
-            )
-            if not amount_str:
-                continue
-
-            try:
-                max_usdc_price_atomic = convert_whole_units_to_atomic(
-                    max_usdc_price,
-                    asset,
-                    wallet_provider,
-                )
-                if max_usdc_price_atomic:
-                    resource_amount = int(amount_str)
-                    max_amount = int(max_usdc_price_atomic)
-                    if resource_amount <= max_amount:
-                        should_include = True
-                        break
-            except (ValueError, TypeError):
-                # Skip if conversion fails
-                continue
-
-        if should_include:
-            filtered.append(resource)
-
-    return filtered
+    networks = frozenset(wallet_networks)
+    context = _get_asset_context(wallet_provider)
+    max_atomic_by_asset: dict[str, str | None] = {}
+    return [
+        resource
+        for resource in resources
+        if _within_max_price(
+            resource, max_usdc_price, wallet_provider, networks, context, max_atomic_by_asset
+        )
+    ]
 
 
 def format_simplified_resources(
@@ -389,13 +705,15 @@ def format_simplified_resources(
         Array of simplified resources with url, price, description
 
     """
+    networks = frozenset(wallet_networks)
+    context = _get_asset_context(wallet_provider)
     simplified: list[SimplifiedResource] = []
 
     for resource in resources:
         accepts = resource.get("accepts", [])
         matching_option = None
         for opt in accepts:
-            if opt.get("network") in wallet_networks:
+            if opt.get("network") in networks:
                 matching_option = opt
                 break
 
@@ -410,22 +728,17 @@ def format_simplified_resources(
 
         price = "Unknown"
 
-        # Get the amount (supports both v1 and v2 formats)
-        amount_str = (
-            matching_option.get("max_amount_required")
-            or matching_option.get("maxAmountRequired")
-            or matching_option.get("amount")
-            or matching_option.get("price")
-        )
+        amount_str = get_payment_amount(matching_option)
         asset = matching_option.get("asset")
         if amount_str and asset:
-            price = format_payment_option(
+            price = _format_payment_option(
                 {
                     "asset": asset,
                     "max_amount_required": amount_str,
                     "network": matching_option.get("network", ""),
                 },
                 wallet_provider,
+                context,
             )
 
         simplified.append(
@@ -503,27 +816,36 @@ def format_payment_option(
         A formatted string like "0.1 USDC on base"
 
     """
-    from ...wallet_providers.evm_wallet_provider import EvmWalletProvider
+    return _format_payment_option(option, wallet_provider, _get_asset_context(wallet_provider))
+
+
+def _format_payment_option(
+    option: dict[str, Any],
+    wallet_provider: WalletProvider,
+    context: _AssetContext,
+) -> str:
+    """Format a payment option using an already resolved asset context.
+
+    Args:
+        option: The payment option to format with keys: asset, max_amount_required, network
+        wallet_provider: The wallet provider for token details lookup
+        context: The wallet's asset context
+
+    Returns:
+        A formatted string like "0.1 USDC on base"
 
+    """
     asset = option.get("asset", "")
     max_amount_required = option.get("max_amount_required", "0")
     network = option.get("network", "")
 
-    # Check if this is an EVM network and we can use ERC20 helpers
-    wallet_network = wallet_provider.get_network()
-    is_evm_network = wallet_network.protocol_family == "evm"
-    is_svm_network = wallet_network.protocol_family == "svm"
-
-    if is_evm_network and isinstance(wallet_provider, EvmWalletProvider):
-        network_id = wallet_network.network_id
-        token_symbols = TOKEN_ADDRESSES_BY_SYMBOLS.get(network_id, {})
-
-        if token_symbols:
-            for symbol, address in token_symbols.items():
-                if asset.lower() == address.lower():
-                    decimals = 6 if symbol in ("USDC", "EURC") else 18
-                    formatted_amount = _format_units(int(max_amount_required), decimals)
-                    return f"{formatted_amount} {symbol} on {get_network_id(network)}"
+    # Use ERC20 helpers on EVM networks
+    if context.is_evm:
+        token = context.tokens.get(asset.lower())
+        if token:
+            symbol, decimals = token
+            formatted_amount = _format_units(int(max_amount_required), decimals)
+            return f"{formatted_amount} {symbol} on {get_network_id(network)}"
 
         # Fall back to get_token_details for unknown tokens
         try:
@@ -535,15 +857,10 @@ def format_payment_option(
             # If we can't get token details, fall back to raw format
             pass
 
-    if is_svm_network:
-        # Check if the asset is USDC on Solana networks
-        network_id = wallet_network.network_id
-        usdc_address = SOLANA_USDC_ADDRESSES.get(network_id)
-
-        if usdc_address and asset == usdc_address:
-            # USDC has 6 decimals on Solana
-            formatted_amount = _format_units(int(max_amount_required), 6)
-            return f"{formatted_amount} USDC on {get_network_id(network)}"
+    # USDC has 6 decimals on Solana
+    if context.is_svm and context.usdc_address and asset == context.usdc_address:
+        formatted_amount = _format_units(int(max_amount_required), 6)
+        return f"{formatted_amount} USDC on {get_network_id(network)}"
 
     # Fallback to original format for non-EVM/SVM networks or when token details can't be fetched
     return f"{asset} {max_amount_required} on {get_network_id(network)}"
@@ -560,28 +877,25 @@ def is_usdc_asset(asset: str, wallet_provider: WalletProvider) -> bool:
         True if the asset is USDC, False otherwise
 
     """
-    from ...wallet_providers.evm_wallet_provider import EvmWalletProvider
-
-    wallet_network = wallet_provider.get_network()
-    is_evm_network = wallet_network.protocol_family == "evm"
-    is_svm_network = wallet_network.protocol_family == "svm"
+    return _is_usdc_asset(asset, _get_asset_context(wallet_provider))
 
-    if is_evm_network and isinstance(wallet_provider, EvmWalletProvider):
-        network_id = wallet_network.network_id
-        token_symbols = TOKEN_ADDRESSES_BY_SYMBOLS.get(network_id, {})
 
-        usdc_address = token_symbols.get("USDC")
-        if usdc_address:
-            return asset.lower() == usdc_address.lower()
+def _is_usdc_asset(asset: str, context: _AssetContext) -> bool:
+    """Check if an asset is USDC using an already resolved asset context.
 
-    if is_svm_network:
-        network_id = wallet_network.network_id
-        usdc_address = SOLANA_USDC_ADDRESSES.get(network_id)
+    Args:
+        asset: The asset address or identifier
+        context: The wallet's asset context
 
-        if usdc_address:
-            return asset == usdc_address
+    Returns:
+        True if the asset is USDC, False otherwise
 
-    return False
+    """
+    if not context.usdc_address:
+        return False
+    if context.is_evm:
+        return asset.lower() == context.usdc_address
+    return asset == context.usdc_address
 
 
 def convert_whole_units_to_atomic(
@@ -600,22 +914,34 @@ def convert_whole_units_to_atomic(
         The amount in atomic units as a string, or None if conversion fails
 
     """
-    from ...wallet_providers.evm_wallet_provider import EvmWalletProvider
+    return _convert_whole_units_to_atomic(
+        whole_units, asset, wallet_provider, _get_asset_context(wallet_provider)
+    )
 
-    # Check if this is an EVM network and we can use ERC20 helpers
-    wallet_network = wallet_provider.get_network()
-    is_evm_network = wallet_network.protocol_family == "evm"
-    is_svm_network = wallet_network.protocol_family == "svm"
 
-    if is_evm_network and isinstance(wallet_provider, EvmWalletProvider):
-        network_id = wallet_network.network_id
-        token_symbols = TOKEN_ADDRESSES_BY_SYMBOLS.get(network_id, {})
+def _convert_whole_units_to_atomic(
+    whole_units: float,
+    asset: str,
+    wallet_provider: WalletProvider,
+    context: _AssetContext,
+) -> str | None:
+    """Convert whole units to atomic units using an already resolved asset context.
+
+    Args:
+        whole_units: The amount in whole units (e.g., 0.1 for 0.1 USDC)
+        asset: The asset address or identifier
+        wallet_provider: The wallet provider for token details lookup
+        context: The wallet's asset context
+
+    Returns:
+        The amount in atomic units as a string, or None if conversion fails
 
-        if token_symbols:
-            for symbol, address in token_symbols.items():
-                if asset.lower() == address.lower():
-                    decimals = 6 if symbol in ("USDC", "EURC") else 18
-                    return _parse_units(whole_units, decimals)
+    """
+    # Use ERC20 helpers on EVM networks
+    if context.is_evm:
+        token = context.tokens.get(asset.lower())
+        if token:
+            return _parse_units(whole_units, token[1])
 
         # Fall back to get_token_details for unknown tokens
         try:
@@ -626,14 +952,9 @@ def convert_whole_units_to_atomic(
             # If we can't get token details, fall back to assuming 18 decimals
             pass
 
-    if is_svm_network:
-        # Check if the asset is USDC on Solana networks
-        network_id = wallet_network.network_id
-        usdc_address = SOLANA_USDC_ADDRESSES.get(network_id)
-
-        if usdc_address and asset == usdc_address:
-            # USDC has 6 decimals on Solana
-            return _parse_units(whole_units, 6)
+    # USDC has 6 decimals on Solana
+    if context.is_svm and context.usdc_address and asset == context.usdc_address:
+        return _parse_units(whole_units, 6)
 
     # Fallback to 18 decimals for unknown tokens or non-EVM/SVM networks
     return _parse_units(whole_units, 18)
@@ -660,6 +981,24 @@ def build_url_with_params(
     return f"{base_url}{separator}{urlencode(query_params)}"
 
 
+@lru_cache(maxsize=4096)
+def _get_origin(url: str) -> str | None:
+    """Get the origin (protocol + hostname + port) of a URL.
+
+    Args:
+        url: The URL to parse
+
+    Returns:
+        The origin string, or None if the URL cannot be parsed
+
+    """
+    try:
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+    except Exception:
+        return None
+
+
 def is_service_registered(url: str, registered_services: set[str]) -> bool:
     """Check if a URL is registered for x402 requests.
 
@@ -677,14 +1016,12 @@ def is_service_registered(url: str, registered_services: set[str]) -> bool:
         return False
 
     try:
-        parsed = urlparse(url)
-        origin = f"{parsed.scheme}://{parsed.netloc}"
+        origin = _get_origin(url)
+        if origin is None:
+            return False
 
-        for registered in registered_services:
-            # Check if origin matches or URL starts with registered prefix
-            if origin == registered or url.startswith(registered):
-                return True
-        return False
+        # Check if origin matches or URL starts with a registered prefix
+        return origin in registered_services or url.startswith(tuple(registered_services))
     except Exception:
         return False
 
@@ -717,7 +1054,8 @@ def filter_usdc_payment_options(
         Array of USDC-only payment options
 
     """
-    return [opt for opt in accepts if is_usdc_asset(opt.get("asset", ""), wallet_provider)]
+    context = _get_asset_context(wallet_provider)
+    return [opt for opt in accepts if _is_usdc_asset(opt.get("asset", ""), context)]
 
 
 def validate_payment_limit(
@@ -735,7 +1073,7 @@ def validate_payment_limit(
 
     """
     usdc_decimals = 6
-    max_amount_atomic = int(max_payment_usdc * (10**usdc_decimals))
+    max_amount_atomic = int(_parse_units(max_payment_usdc, usdc_decimals))
     requested = int(amount_atomic)
 
     return {
@@ -790,9 +1128,7 @@ def _format_units(value: int, decimals: int) -> str:
     if decimals == 0:
         return str(value)
 
-    divisor = 10**decimals
-    whole = value // divisor
-    remainder = value % divisor
+    whole, remainder = divmod(value, 10**decimals)
 
     if remainder == 0:
         return str(whole)
@@ -805,6 +1141,10 @@ def _format_units(value: int, decimals: int) -> str:
 def _parse_units(value: float, decimals: int) -> str:
     """Parse human-readable decimal to atomic units string.
 
+    The value is scaled via its shortest decimal representation rather than float
+    multiplication, so e.g. 0.1 with 18 decimals is exactly 10**17. Digits beyond
+    the token's precision are truncated.
+
     Args:
         value: The value in whole units
         decimals: Number of decimal places
@@ -813,5 +1153,4 @@ def _parse_units(value: float, decimals: int) -> str:
         Atomic units as string
 
     """
-    multiplier = 10**decimals
-    return str(int(value * multiplier))
+    return str(int(Decimal(str(value)).scaleb(decimals)))
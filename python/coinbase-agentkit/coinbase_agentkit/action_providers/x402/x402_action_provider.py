@@ -31,11 +31,7 @@ from .schemas import (
 from .utils import (
     build_url_with_params,
     fetch_all_discovery_resources,
-    filter_by_description,
-    filter_by_keyword,
-    filter_by_max_price,
-    filter_by_network,
-    filter_by_x402_version,
+    filter_discovery_resources,
     filter_usdc_payment_options,
     format_payment_option,
     format_simplified_resources,
@@ -134,25 +130,14 @@ class x402ActionProvider(ActionProvider[WalletProvider]):  # noqa: N801
             # Get the wallet's network identifiers (both v1 and v2 formats)
             wallet_networks = get_x402_networks(wallet_provider.get_network())
 
-            # Apply filter pipeline
-            filtered_resources = filter_by_network(all_resources, wallet_networks)
-            filtered_resources = filter_by_description(filtered_resources)
-            filtered_resources = filter_by_x402_version(
-                filtered_resources, args.get("x402_versions", [1, 2])
-            )
-
-            # Apply keyword filter if provided
-            keyword = args.get("keyword")
-            if keyword:
-                filtered_resources = filter_by_keyword(filtered_resources, keyword)
-
-            # Apply price filter
-            max_usdc_price = args.get("max_usdc_price", 1.0)
-            filtered_resources = filter_by_max_price(
-                filtered_resources,
-                max_usdc_price,
-                wallet_provider,
+            # Apply the network, description, version, keyword and price filters
+            filtered_resources = filter_discovery_resources(
+                all_resources,
                 wallet_networks,
+                wallet_provider,
+                max_usdc_price=args.get("max_usdc_price", 1.0),
+                allowed_versions=args.get("x402_versions", [1, 2]),
+                keyword=args.get("keyword"),
             )
 
             # Format simplified output
@@ -2,11 +2,22 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from coinbase_agentkit.action_providers.aave import utils as aave_utils
 from coinbase_agentkit.action_providers.aave.aave_action_provider import AaveActionProvider
 from coinbase_agentkit.network import Network
 from coinbase_agentkit.wallet_providers import EvmWalletProvider
 
 
+@pytest.fixture(autouse=True)
+def clear_aave_token_caches():
+    """Clear the cached token metadata so tests don't leak reads into each other."""
+    aave_utils._token_decimals_cache.clear()
+    aave_utils._token_symbol_cache.clear()
+    yield
+    aave_utils._token_decimals_cache.clear()
+    aave_utils._token_symbol_cache.clear()
+
+
 @pytest.fixture
 def aave_wallet():
     """Create a mock wallet provider for testing Aave action provider."""
@@ -1,3 +1,18 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from web3 import Web3
+from web3.exceptions import Web3RPCError
+
+from coinbase_agentkit.action_providers.aave.aave_action_provider import (
+    _format_health_factor,
+    _read_account_snapshot,
+)
+from coinbase_agentkit.action_providers.aave.constants import (
+    POOL_ADDRESSES,
+    PRICE_ORACLE_ADDRESSES,
+)
 from coinbase_agentkit.network import Network
 
 
@@ -50,3 +65,140 @@ def test_get_asset_address_invalid_network(aave_provider):
     except (KeyError, ValueError):
         # Accept either KeyError or ValueError since the implementation might use either
         pass
+
+
+def test_borrow_rejects_amount_above_borrowing_capacity(aave_wallet, aave_provider):
+    """Test that borrow values the amount in USD base units before checking capacity."""
+    with patch(
+        "coinbase_agentkit.action_providers.aave.aave_action_provider.get_preflight_data"
+    ) as mock_get_preflight_data:
+        # 100 USDC at $1.00 is 100 * 10^8 base units, twice the available capacity
+        mock_get_preflight_data.return_value = {
+            "decimals": 6,
+            "balance": 0,
+            "accountData": {
+                "totalCollateralBaseUnits": 10**10,
+                "availableBorrowsBaseUnits": 5 * 10**9,
+                "availableBorrowsUSD": Decimal("50"),
+                "healthFactor": Decimal("inf"),
+            },
+            "assetPrice": Decimal("1"),
+            "assetPriceBaseUnits": 10**8,
+        }
+
+        result = aave_provider.borrow(
+            aave_wallet,
+            {"asset_id": "usdc", "amount": "100", "interest_rate_mode": 2, "referral_code": 0},
+        )
+
+    assert "Insufficient borrowing capacity" in result
+    assert "$50.0000" in result
+    aave_wallet.send_transaction.assert_not_called()
+
+
+def test_borrow_without_capacity_does_not_need_asset_price(aave_wallet, aave_provider):
+    """Test that borrow reports missing capacity even when the oracle price is unavailable."""
+    with patch(
+        "coinbase_agentkit.action_providers.aave.aave_action_provider.get_preflight_data"
+    ) as mock_get_preflight_data:
+        mock_get_preflight_data.return_value = {
+            "decimals": 6,
+            "balance": 0,
+            "accountData": {
+                "totalCollateralBaseUnits": 10**10,
+                "availableBorrowsBaseUnits": 0,
+                "availableBorrowsUSD": Decimal("0"),
+                "healthFactor": Decimal("1.1"),
+            },
+            "assetPrice": None,
+            "assetPriceBaseUnits": None,
+        }
+
+        result = aave_provider.borrow(
+            aave_wallet,
+            {"asset_id": "usdc", "amount": "1", "interest_rate_mode": 2, "referral_code": 0},
+        )
+
+    assert result == "Error: You have no borrowing capacity available."
+    aave_wallet.send_transaction.assert_not_called()
+
+
+def test_borrow_succeeds_when_post_transaction_read_fails(aave_wallet, aave_provider):
+    """Test that a failed health factor read after a mined borrow still reports success."""
+    with (
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_preflight_data"
+        ) as mock_get_preflight_data,
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_account_snapshot",
+            side_effect=Web3RPCError("header not found"),
+        ),
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider._encode_call",
+            return_value="0xencoded",
+        ),
+    ):
+        mock_get_preflight_data.return_value = {
+            "decimals": 6,
+            "balance": 0,
+            "accountData": {
+                "totalCollateralBaseUnits": 10**10,
+                "availableBorrowsBaseUnits": 5 * 10**9,
+                "availableBorrowsUSD": Decimal("50"),
+                "healthFactor": Decimal("3"),
+            },
+            "assetPrice": Decimal("1"),
+            "assetPriceBaseUnits": 10**8,
+        }
+        aave_wallet.send_transaction.return_value = "0xtx_hash"
+        aave_wallet.wait_for_transaction_receipt.return_value.status = 1
+
+        result = aave_provider.borrow(
+            aave_wallet,
+            {"asset_id": "usdc", "amount": "10", "interest_rate_mode": 2, "referral_code": 0},
+        )
+
+    assert result.startswith("Successfully borrowed 10 usdc")
+    assert "0xtx_hash" in result
+    aave_wallet.send_transaction.assert_called_once()
+
+
+def test_format_health_factor_matches_format_spec():
+    """Test that health factors format exactly like a two-decimal format spec."""
+    for value in [
+        Decimal("1.005"),
+        Decimal("1.015"),
+        Decimal("2"),
+        Decimal("0.1234"),
+        Decimal(123456789) / Decimal(10**8),
+        Decimal(2**256 - 1) / Decimal(10**18),
+        Decimal("inf"),
+    ]:
+        assert _format_health_factor(value) == f"{value:.2f}"
+
+
+def test_pool_and_oracle_addresses_are_checksummed():
+    """Test that the pool and oracle address constants are stored checksummed."""
+    for address in [*POOL_ADDRESSES.values(), *PRICE_ORACLE_ADDRESSES.values()]:
+        assert address == Web3.to_checksum_address(address)
+
+
+def test_read_account_snapshot_only_swallows_rpc_errors(aave_wallet):
+    """Test that post-transaction reads fall back on RPC errors but surface other bugs."""
+    with patch(
+        "coinbase_agentkit.action_providers.aave.aave_action_provider.get_account_snapshot",
+        side_effect=Web3RPCError("header not found"),
+    ):
+        assert _read_account_snapshot(aave_wallet, "0xpool", "0xasset", 123) == {
+            "accountData": None,
+            "symbol": None,
+        }
+
+    with (
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_account_snapshot",
+            side_effect=KeyError("healthFactor"),
+        ),
+        pytest.raises(KeyError),
+    ):
+        _read_account_snapshot(aave_wallet, "0xpool", "0xasset", 123)
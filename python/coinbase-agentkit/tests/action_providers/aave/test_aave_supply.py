@@ -1,6 +1,9 @@
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
+from web3.exceptions import Web3RPCError
+
+from coinbase_agentkit.action_providers.aave.constants import RECEIPT_POLL_LATENCY
 from coinbase_agentkit.network import Network
 
 
@@ -15,44 +18,45 @@ def test_supply_action_success(aave_wallet, aave_provider):
             "coinbase_agentkit.action_providers.aave.aave_action_provider.format_amount_from_decimals"
         ) as mock_format_from_decimals,
         patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_symbol"
-        ) as mock_get_token_symbol,
-        patch("coinbase_agentkit.action_providers.aave.aave_action_provider.Web3") as mock_web3,
-        patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_health_factor"
-        ) as mock_get_health_factor,
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_account_snapshot"
+        ) as mock_get_account_snapshot,
         patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_balance"
-        ) as mock_get_token_balance,
+            "coinbase_agentkit.action_providers.aave.aave_action_provider._encode_call"
+        ) as mock_encode_call,
         patch(
             "coinbase_agentkit.action_providers.aave.aave_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
         patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_preflight_data"
+        ) as mock_get_preflight_data,
         patch(
             "coinbase_agentkit.action_providers.aave.aave_action_provider.approve_token"
         ) as mock_approve_token,
     ):
         # Setup mocks for utility functions
-        mock_get_token_decimals.return_value = 18
         atomic_amount = int(Decimal("1.0") * Decimal(10**18))
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_token_balance.return_value = atomic_amount * 2  # Ensure sufficient balance
-        # First call returns current health, second call returns new health
-        mock_get_health_factor.side_effect = [Decimal("2.0"), Decimal("3.0")]
-        mock_get_token_symbol.return_value = "WETH"
+        # Preflight returns current health, the post-transaction snapshot returns new health
+        mock_get_preflight_data.return_value = {
+            "decimals": 18,
+            "balance": atomic_amount * 2,  # Ensure sufficient balance
+            "accountData": {"healthFactor": Decimal("2.0")},
+            "assetPrice": None,
+            "assetPriceBaseUnits": None,
+        }
+        mock_get_account_snapshot.return_value = {
+            "accountData": {"healthFactor": Decimal("3.0")},
+            "symbol": "WETH",
+        }
         mock_format_from_decimals.return_value = "1"
         mock_approve_token.return_value = "0xapprove_tx_hash"
 
-        # Setup Web3 mock
-        mock_contract = MagicMock()
-        mock_contract.encode_abi.return_value = "encoded_supply_data"
-        mock_web3.return_value.eth.contract.return_value = mock_contract
-        mock_web3.to_checksum_address.side_effect = lambda addr: addr
+        # Setup calldata encoding mock
+        mock_encode_call.return_value = "encoded_supply_data"
 
         # Setup wallet mock for transaction
         aave_wallet.send_transaction.return_value = "0xtx_hash"
+        aave_wallet.wait_for_transaction_receipt.return_value.blockNumber = 123
 
         # Call the supply action
         result = provider.supply(aave_wallet, input_args)
@@ -65,7 +69,87 @@ def test_supply_action_success(aave_wallet, aave_provider):
 
         # Verify the transaction was sent
         aave_wallet.send_transaction.assert_called_once()
-        aave_wallet.wait_for_transaction_receipt.assert_called_once_with("0xtx_hash")
+        aave_wallet.wait_for_transaction_receipt.assert_called_once_with(
+            "0xtx_hash", poll_latency=RECEIPT_POLL_LATENCY
+        )
+
+        # Verify the new state was read at the transaction's block
+        assert mock_get_account_snapshot.call_args.args[-1] == 123
+
+
+def test_supply_succeeds_when_post_transaction_read_fails(aave_wallet, aave_provider):
+    """Test that a failed account read after a mined supply still reports success."""
+    input_args = {"asset_id": "weth", "amount": "1", "referral_code": 0}
+
+    with (
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_account_snapshot",
+            side_effect=Web3RPCError("header not found"),
+        ),
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider._encode_call",
+            return_value="0xencoded",
+        ),
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_preflight_data"
+        ) as mock_get_preflight_data,
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.approve_token"
+        ) as mock_approve_token,
+    ):
+        atomic_amount = 10**18
+        mock_get_preflight_data.return_value = {
+            "decimals": 18,
+            "balance": atomic_amount * 2,
+            "accountData": {"healthFactor": Decimal("2.0")},
+            "assetPrice": None,
+            "assetPriceBaseUnits": None,
+        }
+        mock_approve_token.return_value = "0xapprove_tx_hash"
+        aave_wallet.send_transaction.return_value = "0xtx_hash"
+
+        result = aave_provider.supply(aave_wallet, input_args)
+
+    assert "Successfully supplied 1 weth" in result
+    assert "0xtx_hash" in result
+    aave_wallet.send_transaction.assert_called_once()
+
+
+def test_supply_reads_latest_when_pinned_block_is_unavailable(aave_wallet, aave_provider):
+    """Test that the post-transaction read falls back to latest if the node lacks the block."""
+    input_args = {"asset_id": "weth", "amount": "1", "referral_code": 0}
+
+    with (
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_account_snapshot",
+            side_effect=[
+                Web3RPCError("header not found"),
+                {"accountData": {"healthFactor": Decimal("3.0")}, "symbol": "WETH"},
+            ],
+        ) as mock_get_account_snapshot,
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider._encode_call",
+            return_value="0xencoded",
+        ),
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_preflight_data"
+        ) as mock_get_preflight_data,
+        patch("coinbase_agentkit.action_providers.aave.aave_action_provider.approve_token"),
+    ):
+        mock_get_preflight_data.return_value = {
+            "decimals": 18,
+            "balance": 2 * 10**18,
+            "accountData": {"healthFactor": Decimal("2.0")},
+            "assetPrice": None,
+            "assetPriceBaseUnits": None,
+        }
+        aave_wallet.send_transaction.return_value = "0xtx_hash"
+        aave_wallet.wait_for_transaction_receipt.return_value.blockNumber = 123
+
+        result = aave_provider.supply(aave_wallet, input_args)
+
+    assert "Health factor changed from 2.00 to 3.00" in result
+    assert [call.args[-1] for call in mock_get_account_snapshot.call_args_list] == [123, "latest"]
 
 
 def test_supply_unsupported_network(aave_wallet, aave_provider):
@@ -111,10 +195,10 @@ def test_supply_token_contract_error(aave_wallet, aave_provider):
     }
 
     with patch(
-        "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_decimals"
-    ) as mock_get_token_decimals:
+        "coinbase_agentkit.action_providers.aave.aave_action_provider.get_preflight_data"
+    ) as mock_get_preflight_data:
         # Simulate error with token contract
-        mock_get_token_decimals.side_effect = Exception("Contract not accessible")
+        mock_get_preflight_data.side_effect = Exception("Contract not accessible")
 
         result = aave_provider.supply(aave_wallet, input_args)
 
@@ -134,22 +218,24 @@ def test_supply_insufficient_balance(aave_wallet, aave_provider):
         patch(
             "coinbase_agentkit.action_providers.aave.aave_action_provider.format_amount_from_decimals"
         ) as mock_format_from_decimals,
-        patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_balance"
-        ) as mock_get_token_balance,
         patch(
             "coinbase_agentkit.action_providers.aave.aave_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
         patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_preflight_data"
+        ) as mock_get_preflight_data,
     ):
         # Setup mocks for utility functions
-        mock_get_token_decimals.return_value = 18
         requested_amount = int(Decimal("5.0") * Decimal(10**18))
         wallet_amount = int(Decimal("2.0") * Decimal(10**18))
         mock_format_amount_with_decimals.return_value = requested_amount
-        mock_get_token_balance.return_value = wallet_amount
+        mock_get_preflight_data.return_value = {
+            "decimals": 18,
+            "balance": wallet_amount,
+            "accountData": None,
+            "assetPrice": None,
+            "assetPriceBaseUnits": None,
+        }
         mock_format_from_decimals.return_value = "2"
 
         result = aave_provider.supply(aave_wallet, input_args)
@@ -167,24 +253,24 @@ def test_supply_balance_check_error(aave_wallet, aave_provider):
     }
 
     with (
-        patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_balance"
-        ) as mock_get_token_balance,
         patch(
             "coinbase_agentkit.action_providers.aave.aave_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
         patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_preflight_data"
+        ) as mock_get_preflight_data,
     ):
         # Setup mocks for utility functions
-        mock_get_token_decimals.return_value = 6
         requested_amount = int(Decimal("10.0") * Decimal(10**6))
         mock_format_amount_with_decimals.return_value = requested_amount
-        # Simulate error checking balance
-        mock_get_token_balance.side_effect = Exception(
-            "Could not transact with/call contract function"
-        )
+        # Simulate the balanceOf read reverting inside the batch
+        mock_get_preflight_data.return_value = {
+            "decimals": 6,
+            "balance": None,
+            "accountData": None,
+            "assetPrice": None,
+            "assetPriceBaseUnits": None,
+        }
 
         result = aave_provider.supply(aave_wallet, input_args)
 
@@ -201,24 +287,26 @@ def test_supply_approval_error(aave_wallet, aave_provider):
     }
 
     with (
-        patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_balance"
-        ) as mock_get_token_balance,
         patch(
             "coinbase_agentkit.action_providers.aave.aave_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
         patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_preflight_data"
+        ) as mock_get_preflight_data,
         patch(
             "coinbase_agentkit.action_providers.aave.aave_action_provider.approve_token"
         ) as mock_approve_token,
     ):
         # Setup mocks for utility functions
-        mock_get_token_decimals.return_value = 18
         atomic_amount = int(Decimal("1.0") * Decimal(10**18))
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_token_balance.return_value = atomic_amount * 2  # Ensure sufficient balance
+        mock_get_preflight_data.return_value = {
+            "decimals": 18,
+            "balance": atomic_amount * 2,  # Ensure sufficient balance
+            "accountData": None,
+            "assetPrice": None,
+            "assetPriceBaseUnits": None,
+        }
         # Simulate approval error
         mock_approve_token.side_effect = Exception("Approval failed")
 
@@ -236,32 +324,33 @@ def test_supply_transaction_error_contract_issue(aave_wallet, aave_provider):
     }
 
     with (
-        patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_balance"
-        ) as mock_get_token_balance,
         patch(
             "coinbase_agentkit.action_providers.aave.aave_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
         patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_preflight_data"
+        ) as mock_get_preflight_data,
         patch(
             "coinbase_agentkit.action_providers.aave.aave_action_provider.approve_token"
         ) as mock_approve_token,
-        patch("coinbase_agentkit.action_providers.aave.aave_action_provider.Web3") as mock_web3,
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider._encode_call"
+        ) as mock_encode_call,
     ):
         # Setup mocks for utility functions
-        mock_get_token_decimals.return_value = 6
         atomic_amount = int(Decimal("10.0") * Decimal(10**6))
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_token_balance.return_value = atomic_amount * 2  # Ensure sufficient balance
+        mock_get_preflight_data.return_value = {
+            "decimals": 6,
+            "balance": atomic_amount * 2,  # Ensure sufficient balance
+            "accountData": None,
+            "assetPrice": None,
+            "assetPriceBaseUnits": None,
+        }
         mock_approve_token.return_value = "0xapprove_tx_hash"
 
-        # Setup Web3 mock
-        mock_contract = MagicMock()
-        mock_contract.encode_abi.return_value = "encoded_supply_data"
-        mock_web3.return_value.eth.contract.return_value = mock_contract
-        mock_web3.to_checksum_address.side_effect = lambda addr: addr
+        # Setup calldata encoding mock
+        mock_encode_call.return_value = "encoded_supply_data"
 
         # Simulate transaction error related to contract deployment
         aave_wallet.send_transaction.side_effect = Exception(
@@ -0,0 +1,186 @@
+from decimal import Decimal
+
+import pytest
+from eth_abi import encode
+from web3 import Web3
+
+from coinbase_agentkit.action_providers.aave import utils as aave_utils
+from coinbase_agentkit.action_providers.aave.constants import MULTICALL3_ADDRESS, POOL_ABI
+from coinbase_agentkit.action_providers.aave.utils import (
+    POW10,
+    _encode_call,
+    format_amount_from_decimals,
+    format_amount_with_decimals,
+    get_account_snapshot,
+    get_preflight_data,
+    multicall,
+)
+from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
+
+
+def test_multicall_decodes_results(aave_wallet, aave_fixtures):
+    """Test that multicall batches reads into one aggregate3 call and decodes each result."""
+    weth = aave_fixtures["asset_addresses"]["weth"]
+    aave_wallet.read_contract.return_value = [
+        (True, encode(["uint8"], [18])),
+        (False, b""),
+    ]
+
+    result = multicall(
+        aave_wallet,
+        [
+            (weth, ERC20_ABI, "decimals", []),
+            (weth, ERC20_ABI, "balanceOf", [weth]),
+        ],
+    )
+
+    assert result == [18, None]
+    aave_wallet.read_contract.assert_called_once()
+    call_kwargs = aave_wallet.read_contract.call_args.kwargs
+    assert call_kwargs["contract_address"] == MULTICALL3_ADDRESS
+    assert call_kwargs["function_name"] == "aggregate3"
+    assert len(call_kwargs["args"][0]) == 2
+
+
+def test_get_preflight_data(aave_wallet, aave_fixtures):
+    """Test that get_preflight_data returns decimals, balance, account data and price."""
+    aave_wallet.get_address.return_value = "0x1234567890123456789012345678901234567890"
+    aave_wallet.read_contract.return_value = [
+        (True, encode(["uint256"], [5 * 10**18])),
+        (True, encode(["uint256"] * 6, [10**10, 10**9, 10**8, 8000, 7000, 2 * 10**18])),
+        (True, encode(["uint8"], [18])),
+        (True, encode(["uint256"], [3000 * 10**8])),
+    ]
+
+    result = get_preflight_data(
+        aave_wallet,
+        "base-mainnet",
+        aave_fixtures["pool_address"],
+        aave_fixtures["asset_addresses"]["weth"],
+    )
+
+    assert result["decimals"] == 18
+    assert result["balance"] == 5 * 10**18
+    assert result["accountData"]["healthFactor"] == Decimal("2")
+    assert result["accountData"]["totalDebtBaseUnits"] == 10**9
+    assert result["assetPrice"] == Decimal("3000")
+    assert result["assetPriceBaseUnits"] == 3000 * 10**8
+
+
+def test_get_account_snapshot(aave_wallet, aave_fixtures):
+    """Test that get_account_snapshot reads account data and symbol in one call at a block."""
+    aave_wallet.get_address.return_value = "0x1234567890123456789012345678901234567890"
+    aave_wallet.read_contract.return_value = [
+        (True, encode(["uint256"] * 6, [10**10, 0, 10**8, 8000, 7000, 0])),
+        (True, encode(["string"], ["WETH"])),
+    ]
+
+    result = get_account_snapshot(
+        aave_wallet,
+        aave_fixtures["pool_address"],
+        aave_fixtures["asset_addresses"]["weth"],
+        block_identifier=123,
+    )
+
+    aave_wallet.read_contract.assert_called_once()
+    assert aave_wallet.read_contract.call_args.kwargs["block_identifier"] == 123
+    assert result["symbol"] == "WETH"
+    assert result["accountData"]["healthFactor"] == Decimal("inf")
+
+
+def test_preflight_and_snapshot_reuse_cached_token_metadata(aave_wallet, aave_fixtures):
+    """Test that decimals and symbol are only read once per network and asset."""
+    aave_wallet.get_address.return_value = "0x1234567890123456789012345678901234567890"
+    weth = aave_fixtures["asset_addresses"]["weth"]
+    account_data = encode(["uint256"] * 6, [10**10, 0, 10**8, 8000, 7000, 0])
+
+    aave_wallet.read_contract.return_value = [
+        (True, encode(["uint256"], [5 * 10**18])),
+        (True, account_data),
+        (True, encode(["uint8"], [18])),
+        (True, encode(["uint256"], [3000 * 10**8])),
+    ]
+    get_preflight_data(aave_wallet, "base-mainnet", aave_fixtures["pool_address"], weth)
+
+    aave_wallet.read_contract.return_value = [
+        (True, encode(["uint256"], [5 * 10**18])),
+        (True, account_data),
+        (True, encode(["uint256"], [3000 * 10**8])),
+    ]
+    result = get_preflight_data(aave_wallet, "base-mainnet", aave_fixtures["pool_address"], weth)
+    assert result["decimals"] == 18
+    assert len(aave_wallet.read_contract.call_args.kwargs["args"][0]) == 3
+
+    aave_wallet.read_contract.return_value = [
+        (True, account_data),
+        (True, encode(["string"], ["WETH"])),
+    ]
+    get_account_snapshot(aave_wallet, aave_fixtures["pool_address"], weth)
+
+    aave_wallet.read_contract.return_value = [(True, account_data)]
+    result = get_account_snapshot(aave_wallet, aave_fixtures["pool_address"], weth)
+    assert result["symbol"] == "WETH"
+    assert len(aave_wallet.read_contract.call_args.kwargs["args"][0]) == 1
+
+
+def test_get_account_snapshot_without_debt_has_infinite_health(aave_wallet, aave_fixtures):
+    """Test that an account without debt reports an infinite health factor."""
+    aave_wallet.get_address.return_value = "0x1234567890123456789012345678901234567890"
+    aave_wallet.read_contract.return_value = [
+        (True, encode(["uint256"] * 6, [10**10, 0, 10**8, 8000, 7000, 2**256 - 1])),
+        (True, encode(["string"], ["WETH"])),
+    ]
+
+    result = get_account_snapshot(
+        aave_wallet, aave_fixtures["pool_address"], aave_fixtures["asset_addresses"]["weth"]
+    )
+
+    assert result["accountData"]["healthFactor"] == Decimal("inf")
+
+
+def test_format_amounts_round_trip_with_pow10_table():
+    """Test that amount formatting scales by the precomputed powers of ten."""
+    assert POW10[6] == 10**6
+    assert format_amount_with_decimals("1.5", 6) == 1_500_000
+    assert format_amount_with_decimals("2", 18) == 2 * 10**18
+    assert format_amount_with_decimals("1e-3", 6) == 1_000
+    assert format_amount_with_decimals("0.1234567", 6) == 123_456
+    assert format_amount_with_decimals("max", 6) == 2**256 - 1
+    assert format_amount_from_decimals(1_500_000, 6) == "1.5"
+    assert format_amount_from_decimals(0, 6) == "0"
+    assert format_amount_from_decimals(2 * 10**18, 18) == "2"
+    assert format_amount_from_decimals(1, 18) == "0.000000000000000001"
+    assert format_amount_from_decimals(2**256 - 1, 18) == (
+        "115792089237316195423570985008687907853269984665640564039457.584007913129639935"
+    )
+    with pytest.raises(ValueError, match="Invalid amount format"):
+        format_amount_with_decimals("1.2.3", 1)
+
+
+def test_encode_call_matches_contract_encoding(aave_fixtures):
+    """Test that cached-selector encoding matches web3 contract encoding."""
+    pool = Web3.to_checksum_address(aave_fixtures["pool_address"])
+    weth = Web3.to_checksum_address(aave_fixtures["asset_addresses"]["weth"])
+    usdc = Web3.to_checksum_address(aave_fixtures["asset_addresses"]["usdc"])
+    calls = [
+        (ERC20_ABI, "approve", [pool, 10**18]),
+        (ERC20_ABI, "decimals", []),
+        (POOL_ABI, "setUserUseReserveAsCollateral", [weth, True]),
+        (POOL_ABI, "supply", [weth, 10**18, usdc, 0]),
+        (POOL_ABI, "withdraw", [weth, 2**256 - 1, usdc]),
+        (POOL_ABI, "borrow", [weth, 10**18, 2, 0, usdc]),
+        (POOL_ABI, "repay", [weth, 10**18, 2, usdc]),
+    ]
+
+    for abi, function_name, args in calls:
+        expected = Web3().eth.contract(abi=abi).encode_abi(function_name, args=args)
+        assert _encode_call(abi, function_name, args) == expected
+
+
+def test_encode_call_does_not_cache_other_abis():
+    """Test that ABIs other than the module constants are encoded without being cached."""
+    abi = [dict(item) for item in ERC20_ABI]
+    cached_abis = len(aave_utils._ABI_CODECS)
+
+    assert _encode_call(abi, "decimals", []) == _encode_call(ERC20_ABI, "decimals", [])
+    assert len(aave_utils._ABI_CODECS) == cached_abis
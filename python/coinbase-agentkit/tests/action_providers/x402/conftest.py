@@ -5,6 +5,7 @@ from unittest.mock import Mock, patch
 import pytest
 import requests
 
+from coinbase_agentkit.action_providers.x402 import utils as x402_utils
 from coinbase_agentkit.wallet_providers.evm_wallet_provider import EvmWalletProvider
 
 # Mock data constants
@@ -29,6 +30,14 @@ MOCK_PAYMENT_PROOF = {
 }
 
 
+@pytest.fixture(autouse=True)
+def clear_discovery_page_cache():
+    """Clear cached discovery pages so tests don't leak responses into each other."""
+    x402_utils._discovery_page_cache.clear()
+    yield
+    x402_utils._discovery_page_cache.clear()
+
+
 @pytest.fixture
 def mock_wallet():
     """Create a mock wallet provider."""
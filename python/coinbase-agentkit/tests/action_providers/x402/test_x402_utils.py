@@ -0,0 +1,389 @@
+"""Tests for x402 utility functions."""
+
+import json
+from http.client import HTTPMessage
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from requests.cookies import MockRequest, MockResponse
+
+from coinbase_agentkit.action_providers.x402 import utils as x402_utils
+from coinbase_agentkit.action_providers.x402.utils import (
+    _fetch_discovery_page,
+    _fetch_with_retry,
+    _format_units,
+    _parse_units,
+    fetch_all_discovery_resources,
+    filter_by_description,
+    filter_by_keyword,
+    filter_by_max_price,
+    filter_by_network,
+    filter_by_x402_version,
+    filter_discovery_resources,
+    get_network_id,
+    get_payment_amount,
+    handle_http_error,
+    is_service_registered,
+    validate_payment_limit,
+)
+from coinbase_agentkit.network import Network
+
+from .conftest import MOCK_PAYMENT_REQUIREMENTS
+
+
+def test_get_network_id_maps_v1_and_v2_identifiers():
+    """Test that both v1 and CAIP-2 identifiers map back to the internal network ID."""
+    assert get_network_id("base") == "base-mainnet"
+    assert get_network_id("eip155:84532") == "base-sepolia"
+    assert get_network_id("solana:5eykt4UsFv8P8NJdTREpY1vzqKqZKvdp") == "solana-mainnet"
+    assert get_network_id("unknown-network") == "unknown-network"
+
+
+def test_get_payment_amount_supports_v1_and_v2_options():
+    """Test that the required amount is read from either payment option format."""
+    assert get_payment_amount({"max_amount_required": "100"}) == "100"
+    assert get_payment_amount({"maxAmountRequired": "200"}) == "200"
+    assert get_payment_amount({"amount": "300", "price": "$0.01"}) == "300"
+    assert get_payment_amount({"price": "$0.01"}) == "$0.01"
+    assert get_payment_amount({"network": "base"}) is None
+
+
+def _discovery_responses(pages, failing_offsets=()):
+    """Build a fake _fetch_with_retry that serves discovery pages by offset."""
+
+    def fetch(url, context="", headers=None):
+        offset = int(url.rsplit("offset=", 1)[1])
+        if offset in failing_offsets:
+            raise RuntimeError(f"Failed to fetch ({context})")
+        return Mock(status_code=200, headers={}, content=json.dumps(pages[offset]).encode())
+
+    return fetch
+
+
+def _discovery_resource(url, description, network="base-sepolia", amount="1000", version=1):
+    """Build a v1 discovery resource with a single USDC payment option."""
+    return {
+        "resource": url,
+        "x402Version": version,
+        "accepts": [
+            {
+                "network": network,
+                "asset": MOCK_PAYMENT_REQUIREMENTS["asset"],
+                "maxAmountRequired": amount,
+                "description": description,
+            }
+        ],
+    }
+
+
+def test_filter_discovery_resources_matches_chained_filters(mock_wallet):
+    """Test that the single-pass filter keeps the same resources as the chained filters."""
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-sepolia", chain_id="84532"
+    )
+    wallet_networks = ["base-sepolia", "eip155:84532"]
+    resources = [
+        _discovery_resource("https://weather.example", "Weather data"),
+        _discovery_resource("https://weather.example/premium", "Forecasts", amount="5000000"),
+        _discovery_resource("https://news.example", "News headlines"),
+        _discovery_resource("https://weather.example/mainnet", "Weather", network="base"),
+        _discovery_resource("https://weather.example/default", "Access to protected content"),
+        _discovery_resource("https://weather.example/v3", "Weather data", version=3),
+    ]
+
+    chained = filter_by_network(resources, wallet_networks)
+    chained = filter_by_description(chained)
+    chained = filter_by_x402_version(chained, [1, 2])
+    chained = filter_by_keyword(chained, "WEATHER")
+    chained = filter_by_max_price(chained, 1.0, mock_wallet, wallet_networks)
+
+    fused = filter_discovery_resources(
+        resources, wallet_networks, mock_wallet, max_usdc_price=1.0, keyword="WEATHER"
+    )
+
+    assert fused == chained == [resources[0]]
+
+
+def test_filter_discovery_resources_resolves_wallet_network_once(mock_wallet):
+    """Test that the wallet network is resolved once per call, not per payment option."""
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-sepolia", chain_id="84532"
+    )
+    resources = [
+        _discovery_resource(f"https://{index}.example", "Weather data") for index in range(5)
+    ]
+
+    filtered = filter_discovery_resources(resources, ["base-sepolia"], mock_wallet)
+
+    assert filtered == resources
+    mock_wallet.get_network.assert_called_once()
+
+
+def test_fetch_all_discovery_resources_parses_pages():
+    """Test that discovery pages are parsed from the raw body and fetched until the total."""
+    pages = {
+        offset: {"items": [{"resource": f"https://{offset}.example"}], "pagination": {"total": 4}}
+        for offset in range(4)
+    }
+
+    with patch(
+        "coinbase_agentkit.action_providers.x402.utils._fetch_with_retry",
+        side_effect=_discovery_responses(pages),
+    ) as mock_fetch:
+        resources = fetch_all_discovery_resources("https://discovery.example", page_size=1)
+
+    assert [resource["resource"] for resource in resources] == [
+        "https://0.example",
+        "https://1.example",
+        "https://2.example",
+        "https://3.example",
+    ]
+    assert mock_fetch.call_count == 4
+
+
+def test_fetch_all_discovery_resources_skips_failed_pages():
+    """Test that a page failing after retries is skipped without dropping the others."""
+    pages = {
+        offset: {"items": [{"resource": f"https://{offset}.example"}], "pagination": {"total": 3}}
+        for offset in range(3)
+    }
+
+    with patch(
+        "coinbase_agentkit.action_providers.x402.utils._fetch_with_retry",
+        side_effect=_discovery_responses(pages, failing_offsets={1}),
+    ):
+        resources = fetch_all_discovery_resources("https://discovery.example", page_size=1)
+
+    assert [resource["resource"] for resource in resources] == [
+        "https://0.example",
+        "https://2.example",
+    ]
+
+
+def test_fetch_all_discovery_resources_first_page_failure():
+    """Test that nothing is returned when the first page cannot be fetched."""
+    with patch(
+        "coinbase_agentkit.action_providers.x402.utils._fetch_with_retry",
+        side_effect=_discovery_responses({}, failing_offsets={0}),
+    ) as mock_fetch:
+        assert fetch_all_discovery_resources("https://discovery.example") == []
+
+    assert mock_fetch.call_count == 1
+
+
+def test_fetch_all_discovery_resources_revalidates_cached_pages():
+    """Test that pages with an ETag are revalidated and reused on 304 Not Modified."""
+    page = {"items": [{"resource": "https://a.example"}], "pagination": {"total": 1}}
+    responses = [
+        Mock(status_code=200, headers={"ETag": '"v1"'}, content=json.dumps(page).encode()),
+        Mock(status_code=304, headers={}, content=b""),
+    ]
+
+    with patch(
+        "coinbase_agentkit.action_providers.x402.utils._fetch_with_retry",
+        side_effect=responses,
+    ) as mock_fetch:
+        first = fetch_all_discovery_resources("https://discovery.example")
+        second = fetch_all_discovery_resources("https://discovery.example")
+
+    assert first == second == page["items"]
+    assert mock_fetch.call_args_list[0].kwargs["headers"] is None
+    assert mock_fetch.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_fetch_discovery_page_returns_a_copy_of_cached_resources():
+    """Test that a revalidated page can't be used to modify the cached entry."""
+    page = {"items": [{"resource": "https://a.example"}], "pagination": {"total": 1}}
+    responses = [
+        Mock(status_code=200, headers={"ETag": '"v1"'}, content=json.dumps(page).encode()),
+        Mock(status_code=304, headers={}, content=b""),
+        Mock(status_code=304, headers={}, content=b""),
+    ]
+
+    with patch(
+        "coinbase_agentkit.action_providers.x402.utils._fetch_with_retry",
+        side_effect=responses,
+    ):
+        _fetch_discovery_page("https://discovery.example?offset=0", "page 1")
+        revalidated, _ = _fetch_discovery_page("https://discovery.example?offset=0", "page 1")
+        revalidated.clear()
+        resources, total = _fetch_discovery_page("https://discovery.example?offset=0", "page 1")
+
+    assert (resources, total) == (page["items"], 1)
+
+
+def test_fetch_discovery_page_evicts_oldest_cached_pages():
+    """Test that the page cache is capped and drops the oldest pages first."""
+    page = {"items": [], "pagination": {"total": 0}}
+
+    with (
+        patch("coinbase_agentkit.action_providers.x402.utils.DISCOVERY_PAGE_CACHE_SIZE", 2),
+        patch(
+            "coinbase_agentkit.action_providers.x402.utils._fetch_with_retry",
+            side_effect=lambda *args, **kwargs: Mock(
+                status_code=200, headers={"ETag": '"v1"'}, content=json.dumps(page).encode()
+            ),
+        ),
+    ):
+        for offset in range(3):
+            _fetch_discovery_page(f"https://discovery.example?offset={offset}", "page")
+
+    assert list(x402_utils._discovery_page_cache) == [
+        "https://discovery.example?offset=1",
+        "https://discovery.example?offset=2",
+    ]
+
+
+def test_fetch_with_retry_reuses_session_and_retries():
+    """Test that fetches go through the shared session and retry failed responses."""
+    failed = Mock(ok=False, status_code=503, reason="Service Unavailable", headers={})
+    succeeded = Mock(ok=True)
+
+    with (
+        patch(
+            "coinbase_agentkit.action_providers.x402.utils._SESSION.get",
+            side_effect=[failed, succeeded],
+        ) as mock_get,
+        patch("coinbase_agentkit.action_providers.x402.utils.random.uniform", return_value=1.0),
+        patch("coinbase_agentkit.action_providers.x402.utils.time.sleep") as mock_sleep,
+    ):
+        assert _fetch_with_retry("https://discovery.example", max_retries=1) is succeeded
+
+    assert mock_get.call_count == 2
+    mock_sleep.assert_called_once_with(1.0)
+
+
+def test_discovery_session_does_not_store_cookies():
+    """Test that the session shared by the fetch workers keeps its cookie jar empty."""
+    headers = HTTPMessage()
+    headers["Set-Cookie"] = "session=abc; Path=/"
+    request = requests.Request("GET", "https://discovery.example/").prepare()
+
+    x402_utils._SESSION.cookies.extract_cookies(MockResponse(headers), MockRequest(request))
+
+    assert len(x402_utils._SESSION.cookies) == 0
+
+
+def test_fetch_with_retry_honours_retry_after():
+    """Test that a Retry-After header longer than the backoff delay is respected."""
+    rate_limited = Mock(
+        ok=False, status_code=429, reason="Too Many Requests", headers={"Retry-After": "5"}
+    )
+    succeeded = Mock(ok=True)
+
+    with (
+        patch(
+            "coinbase_agentkit.action_providers.x402.utils._SESSION.get",
+            side_effect=[rate_limited, succeeded],
+        ),
+        patch("coinbase_agentkit.action_providers.x402.utils.time.sleep") as mock_sleep,
+    ):
+        assert _fetch_with_retry("https://discovery.example", max_retries=1) is succeeded
+
+    mock_sleep.assert_called_once_with(5.0)
+
+
+def test_fetch_with_retry_does_not_retry_client_errors():
+    """Test that client errors other than 429 fail without retrying."""
+    not_found = Mock(ok=False, status_code=404, reason="Not Found", headers={})
+
+    with (
+        patch(
+            "coinbase_agentkit.action_providers.x402.utils._SESSION.get",
+            return_value=not_found,
+        ) as mock_get,
+        patch("coinbase_agentkit.action_providers.x402.utils.time.sleep") as mock_sleep,
+        pytest.raises(RuntimeError, match="HTTP 404 Not Found"),
+    ):
+        _fetch_with_retry("https://discovery.example", max_retries=3)
+
+    mock_get.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_parse_units_is_exact_for_decimal_inputs():
+    """Test that whole units are scaled without float rounding errors."""
+    assert _parse_units(0.1, 18) == "100000000000000000"
+    assert _parse_units(1.005, 6) == "1005000"
+    assert _parse_units(0.0000001, 6) == "0"
+    assert _parse_units(2, 6) == "2000000"
+
+
+def test_format_units_round_trips_atomic_amounts():
+    """Test that atomic amounts are formatted without trailing zeros."""
+    assert _format_units(1005000, 6) == "1.005"
+    assert _format_units(2000000, 6) == "2"
+    assert _format_units(1, 18) == "0.000000000000000001"
+    assert _format_units(42, 0) == "42"
+
+
+def test_validate_payment_limit_uses_exact_limit():
+    """Test that a payment equal to a non-binary-exact limit is accepted."""
+    assert validate_payment_limit("1005000", 1.005)["is_valid"] is True
+    assert validate_payment_limit("1005001", 1.005)["is_valid"] is False
+
+
+def test_is_service_registered_matches_origin_or_prefix():
+    """Test that URLs match registered services by origin or by prefix."""
+    registered = {"https://api.example.com", "https://other.example/v1/"}
+
+    assert is_service_registered("https://api.example.com/data?x=1", registered)
+    assert is_service_registered("https://other.example/v1/weather", registered)
+    assert not is_service_registered("https://other.example/v2/weather", registered)
+    assert not is_service_registered("http://[::1/data", registered)
+    assert not is_service_registered("https://api.example.com/data", set())
+
+
+@pytest.mark.parametrize(
+    "url", [None, 123, b"https://api.example.com", ["https://api.example.com"]]
+)
+def test_is_service_registered_rejects_non_string_urls(url):
+    """Test that malformed URL arguments are treated as unregistered instead of raising."""
+    assert not is_service_registered(url, {"https://api.example.com"})
+
+
+def test_handle_http_error_formats_response_errors():
+    """Test that HTTP errors are serialized as indented JSON with the response details."""
+    response = Mock(status_code=404)
+    response.json.return_value = {"error": "Not found"}
+    error = Exception("404 Client Error")
+    error.response = response
+
+    result = handle_http_error(error, "https://api.example.com")
+
+    assert result.startswith('{\n  "error": true')
+    assert json.loads(result) == {
+        "error": True,
+        "message": "HTTP 404 error when accessing https://api.example.com",
+        "details": "Not found",
+        "suggestion": "Check if the URL is correct and the API is available.",
+    }
+
+
+def test_handle_http_error_keeps_large_integers():
+    """Test that error bodies with integers beyond 64 bits are serialized exactly."""
+    response = Mock(status_code=402)
+    response.json.return_value = {"error": {"maxAmountRequired": 10**20}}
+    error = Exception("402 Payment Required")
+    error.response = response
+
+    result = handle_http_error(error, "https://api.example.com")
+
+    assert json.loads(result)["details"] == {"maxAmountRequired": 10**20}
+
+
+def test_fetch_all_discovery_resources_keeps_large_integer_amounts():
+    """Test that amounts sent as JSON numbers beyond 64 bits are parsed exactly."""
+    page = (
+        b'{"items": [{"resource": "https://a.example", '
+        b'"accepts": [{"amount": 123456789012345678901234567890}]}], "pagination": {"total": 1}}'
+    )
+
+    with patch(
+        "coinbase_agentkit.action_providers.x402.utils._fetch_with_retry",
+        return_value=Mock(status_code=200, headers={}, content=page),
+    ):
+        resources = fetch_all_discovery_resources("https://discovery.example")
+
+    assert resources[0]["accepts"][0]["amount"] == 123456789012345678901234567890